@@ -1,6 +1,11 @@
 import sys
 import os
+import atexit
+import importlib.util
 import logging
+import logging.handlers
+import queue
+import threading
 from datetime import datetime
 
 def check_dependencies():
@@ -14,15 +19,15 @@ def check_dependencies():
         'openpyxl': 'openpyxl',
         'xlsxwriter': 'xlsxwriter',
         'reportlab': 'reportlab',
-        'psutil': 'psutil'
+        'psutil': 'psutil',
+        'pyarrow': 'pyarrow'
     }
     
-    missing_packages = []
-    for package, import_name in required_packages.items():
-        try:
-            __import__(import_name)
-        except ImportError:
-            missing_packages.append(package)
+    # find_spec only locates the packages; it does not run their import code
+    missing_packages = [
+        package for package, import_name in required_packages.items()
+        if importlib.util.find_spec(import_name) is None
+    ]
     
     if missing_packages:
         error_msg = "Missing required packages. Please install:\n"
@@ -41,19 +46,25 @@ check_dependencies()
 
 # Now import other modules
 import pandas as pd
-import polars as pl
 import glob
+import io
 import re
 import json
-from sqlalchemy import create_engine
+import gc
+from itertools import islice
+from importlib import metadata
 from PyQt6.QtWidgets import QAbstractItemView, QProgressBar, QMenu, QSizePolicy
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 import numpy as np
 import traceback
 
+# polars, matplotlib and seaborn are imported where they are used to keep startup fast
+
+# Prefer the Rust-based calamine Excel reader when it is installed
+CALAMINE_AVAILABLE = importlib.util.find_spec('python_calamine') is not None
+
+# Prefer orjson for JSON export when it is installed
+ORJSON_AVAILABLE = importlib.util.find_spec('orjson') is not None
+
 # Try to import psutil, but don't fail if it's not available
 try:
     import psutil
@@ -62,6 +73,30 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     logging.warning("psutil module not available. Memory information will not be logged.")
 
+class _LocationFilter(logging.Filter):
+    """Attach the source location only to warnings and errors"""
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            record.location = f"\n{record.pathname}:{record.lineno}\n"
+        else:
+            record.location = ""
+        return True
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that leaves records in a large write buffer instead of flushing each one"""
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, buffering=256 * 1024)
+
+    def flush(self):
+        # StreamHandler.emit flushes after every record; the buffer is flushed when the
+        # handler is closed at exit and after warnings and errors below
+        pass
+
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            super().flush()
+
 # Configure logging with more detailed format
 def setup_logging():
     # Create logs directory if it doesn't exist
@@ -72,89 +107,91 @@ def setup_logging():
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = f'logs/app_{timestamp}.log'
     
-    # Configure logging format with more details
+    # Log level defaults to INFO; set PYQTCSV_LOGLEVEL=DEBUG for more detail
+    log_level = logging.getLevelName(os.environ.get('PYQTCSV_LOGLEVEL', 'INFO').upper())
+    if not isinstance(log_level, int):
+        log_level = logging.INFO
+    
+    # Configure logging format, with source location for warnings and errors only
+    formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s %(message)s%(location)s')
+    location_filter = _LocationFilter()
+    
+    # Write the log file through a large buffer instead of one syscall per record
+    file_handler = _BufferedFileHandler(log_file, mode='a', encoding='utf-8', delay=True)
+    file_handler.setFormatter(formatter)
+    file_handler.addFilter(location_filter)
+    stream_handler = logging.StreamHandler()  # Also print to console
+    stream_handler.setFormatter(formatter)
+    stream_handler.addFilter(location_filter)
+    
+    # Callers only enqueue records; a single listener thread does the actual IO
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
     logging.basicConfig(
-        level=logging.DEBUG,  # Set to DEBUG for maximum logging
-        format='%(asctime)s - %(levelname)s - [%(name)s] - %(message)s\n%(pathname)s:%(lineno)d\n',
-        handlers=[
-            logging.FileHandler(log_file, mode='a', encoding='utf-8'),
-            logging.StreamHandler()  # Also print to console
-        ]
+        level=log_level,
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
     
     # Create a logger instance
     logger = logging.getLogger(__name__)
     
-    # Log system information in the background
-    def log_system_info():
-        try:
-            logger.info("Application started")
-            logger.info(f"Python version: {sys.version}")
-            logger.info(f"Operating System: {sys.platform}")
-            logger.info(f"Working Directory: {os.getcwd()}")
-            
-            if PSUTIL_AVAILABLE:
-                try:
-                    memory = psutil.virtual_memory()
-                    logger.info(f"System Memory: {memory.total / (1024**3):.2f} GB")
-                    logger.info(f"Available Memory: {memory.available / (1024**3):.2f} GB")
-                    logger.info(f"Memory Usage: {memory.percent}%")
-                except Exception as e:
-                    logger.warning(f"Failed to log memory information: {str(e)}")
-            
-            # Log package versions
-            logger.info(f"Pandas version: {pd.__version__}")
-            logger.info(f"Polars version: {pl.__version__}")
-            logger.info(f"PyQt6 version: {sys.modules['PyQt6'].__version__}")
-            logger.info(f"Matplotlib version: {plt.__version__}")
-            logger.info(f"Seaborn version: {sns.__version__}")
-            logger.info(f"Numpy version: {np.__version__}")
-        except Exception as e:
-            logger.error(f"Failed to log system information: {str(e)}", exc_info=True)
-    
-    # Start logging in a background thread
-    import threading
-    thread = threading.Thread(target=log_system_info)
-    thread.daemon = True
-    thread.start()
-    
     return logger
 
 # Initialize logger
 logger = setup_logging()
 
-# Log system information
-logger.info(f"Python version: {sys.version}")
-logger.info(f"Operating System: {sys.platform}")
-logger.info(f"Working Directory: {os.getcwd()}")
-
-# Log memory information if psutil is available
-if PSUTIL_AVAILABLE:
+def log_system_info():
+    """Log environment details; scheduled once the Qt event loop is running"""
     try:
-        memory = psutil.virtual_memory()
-        logger.info(f"System Memory: {memory.total / (1024**3):.2f} GB")
-        logger.info(f"Available Memory: {memory.available / (1024**3):.2f} GB")
-        logger.info(f"Memory Usage: {memory.percent}%")
+        logger.info("Application started")
+        logger.info(f"Python version: {sys.version}")
+        logger.info(f"Operating System: {sys.platform}")
+        logger.info(f"Working Directory: {os.getcwd()}")
+        
+        if PSUTIL_AVAILABLE:
+            try:
+                memory = psutil.virtual_memory()
+                logger.info(f"System Memory: {memory.total / (1024**3):.2f} GB")
+                logger.info(f"Available Memory: {memory.available / (1024**3):.2f} GB")
+                logger.info(f"Memory Usage: {memory.percent}%")
+            except Exception as e:
+                logger.warning(f"Failed to log memory information: {str(e)}")
+        
+        # Log package versions
+        logger.info(f"Pandas version: {metadata.version('pandas')}")
+        logger.info(f"Polars version: {metadata.version('polars')}")
+        logger.info(f"PyQt6 version: {metadata.version('PyQt6')}")
+        logger.info(f"Matplotlib version: {metadata.version('matplotlib')}")
+        logger.info(f"Seaborn version: {metadata.version('seaborn')}")
+        logger.info(f"Numpy version: {metadata.version('numpy')}")
     except Exception as e:
-        logger.warning(f"Failed to log memory information: {str(e)}")
+        logger.error(f"Failed to log system information: {str(e)}", exc_info=True)
 
-# Log imported package versions
-try:
-    logger.info(f"Pandas version: {pd.__version__}")
-    logger.info(f"Polars version: {pl.__version__}")
-    logger.info(f"PyQt6 version: {sys.modules['PyQt6'].__version__}")
-    logger.info(f"Matplotlib version: {plt.__version__}")
-    logger.info(f"Seaborn version: {sns.__version__}")
-    logger.info(f"Numpy version: {np.__version__}")
-except Exception as e:
-    logger.error(f"Failed to log package versions: {str(e)}", exc_info=True)
+def resource_path(relative_path):
+    """Resolve a bundled resource both from source and from a PyInstaller build"""
+    base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
+
+def load_stylesheet(file_name='app.qss'):
+    """Read the application-wide Qt stylesheet"""
+    try:
+        with open(resource_path(file_name), 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError as e:
+        logger.warning(f"Failed to load stylesheet {file_name}: {str(e)}")
+        return ""
 
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QLineEdit, QFileDialog,
-    QTableView, QLabel, QComboBox, QCheckBox, QHBoxLayout, QMessageBox, QAbstractScrollArea, QHeaderView, QDialog, QScrollArea, QWidget as QScrollWidget
+    QTableView, QLabel, QComboBox, QCheckBox, QHBoxLayout, QMessageBox, QAbstractScrollArea, QHeaderView, QDialog, QListView
 )
-from PyQt6.QtCore import QAbstractTableModel, Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QColor, QAction, QPalette
+from PyQt6.QtCore import QAbstractTableModel, Qt, QSignalBlocker, QStringListModel, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QAction, QPalette, QStandardItem, QStandardItemModel
 
 # -------------------- Model for Fast Table View Rendering -------------------- #
 class PandasTableModel(QAbstractTableModel):
@@ -169,43 +206,43 @@ class PandasTableModel(QAbstractTableModel):
         self._sort_column = -1
         self._sort_order = Qt.SortOrder.AscendingOrder
         self.duplicate_columns = []
-        self._cache = {}
-        self._row_cache = {}
-        self._column_cache = {}
+        self._dup_col_mask = np.zeros(df.shape[1], dtype=bool)
+        self._hl_mask = None
+        self.clear_cache()
         self.logger.info(f"PandasTableModel initialized with DataFrame shape: {df.shape}")
 
     def rowCount(self, parent=None):
+        if self._row_perm is not None:
+            return len(self._row_perm)
         return self._df.shape[0]
 
     def columnCount(self, parent=None):
         return self._df.shape[1]
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        # The view asks for every role on every paint; bail out before any work
+        if role != Qt.ItemDataRole.DisplayRole and role != Qt.ItemDataRole.BackgroundRole:
+            return None
         try:
             if not index.isValid():
                 return None
             
             row, col = index.row(), index.column()
+            if self._row_perm is not None:
+                row = self._row_perm[row]
             
             if role == Qt.ItemDataRole.DisplayRole:
-                    cache_key = (row, col)
-                    if cache_key not in self._cache:
-                        self._cache[cache_key] = str(self._df.iloc[row, col])
-                    return self._cache[cache_key]
+                    # Loaders keep every cell as a Python string, so no str() per paint
+                    return self._values[row, col]
                     
             elif role == Qt.ItemDataRole.BackgroundRole:
-                    value = str(self._df.iloc[row, col])
-                    
-                    for pattern in self.highlight_patterns:
-                        if pattern in value:
-                            return self.highlight_color
+                    if self._hl_mask is not None and self._hl_mask[row, col]:
+                        return self.highlight_color
                     
-                    if col in self.duplicate_columns:
+                    if self._dup_col_mask[col]:
                         return self.duplicate_color
                         
                     return None
-                    
-            return None
         except Exception as e:
             self.logger.error(f"Error in data method: {str(e)}", exc_info=True)
             return None
@@ -213,52 +250,189 @@ class PandasTableModel(QAbstractTableModel):
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if role == Qt.ItemDataRole.DisplayRole:
             if orientation == Qt.Orientation.Horizontal:
-                if section not in self._column_cache:
-                    self._column_cache[section] = self._df.columns[section]
-                return self._column_cache[section]
+                return self._columns[section]
             else:
-                if section not in self._row_cache:
-                    self._row_cache[section] = str(section)
-                return self._row_cache[section]
+                return str(section)
         return None
 
     def set_highlight_patterns(self, patterns):
         self.highlight_patterns = patterns
-        self._cache.clear()  # Clear cache when highlighting changes
-        self.layoutChanged.emit()
+        self._build_highlight_mask()
+        self._emit_background_changed()
 
     def set_duplicate_columns(self, columns):
         self.duplicate_columns = columns
-        self._cache.clear()  # Clear cache when duplicates change
-        self.layoutChanged.emit()
+        self._dup_col_mask = np.zeros(self.columnCount(), dtype=bool)
+        self._dup_col_mask[list(columns)] = True
+        self._emit_background_changed()
+
+    def _emit_background_changed(self):
+        """Tell the view only cell colors changed, not the data or row order"""
+        if self.rowCount() == 0 or self.columnCount() == 0:
+            return
+        top_left = self.index(0, 0)
+        bottom_right = self.index(self.rowCount() - 1, self.columnCount() - 1)
+        self.dataChanged.emit(top_left, bottom_right, [Qt.ItemDataRole.BackgroundRole])
 
     def sort(self, column, order=Qt.SortOrder.AscendingOrder):
         try:
-            self.logger.debug(f"Sorting column {column} in {'ascending' if order == Qt.SortOrder.AscendingOrder else 'descending'} order")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Sorting column {column} in {'ascending' if order == Qt.SortOrder.AscendingOrder else 'descending'} order")
             self._sort_column = column
             self._sort_order = order
             
             if column >= 0 and column < self._df.shape[1]:
-                ascending = order == Qt.SortOrder.AscendingOrder
-                self._df = self._df.sort_values(
-                    by=self._df.columns[column],
-                    ascending=ascending,
-                    na_position='last'
-                )
-                self._cache.clear()
-                self.layoutChanged.emit()
+                # Sort only a row permutation; the backing array stays in load order
+                # and visible cells are mapped through the permutation on demand
+                column_values = self._values[:, column]
+                if self._row_perm is not None:
+                    column_values = column_values[self._row_perm]
+                # Cells are already str objects; argsort the object array directly instead of
+                # copying it into a fixed-width unicode array sized by the longest cell
+                row_order = np.argsort(column_values, kind='stable')
+                if order == Qt.SortOrder.DescendingOrder:
+                    row_order = row_order[::-1]
+                self.beginResetModel()
+                self._row_perm = row_order if self._row_perm is None else self._row_perm[row_order]
+                self.endResetModel()
                 self.logger.debug("Sort completed successfully")
         except Exception as e:
             self.logger.error(f"Error in sort method: {str(e)}", exc_info=True)
 
-    def get_dataframe(self):
-        return self._df.copy()
+    def get_dataframe(self, copy=False):
+        """Return the data in display order; copy before mutating unless copy=True"""
+        df = self._df if self._row_perm is None else self._df.iloc[self._row_perm]
+        return df.copy() if copy else df
+
+    def get_rows(self, rows, columns=None):
+        """Return the given view rows (and columns), mapped through the current sort, as a new DataFrame"""
+        if self._row_perm is not None:
+            rows = self._row_perm[rows]
+        if columns is None:
+            return self._df.take(rows)
+        # One indexing step so only the requested cells are copied
+        return self._df.iloc[rows, self._df.columns.get_indexer(columns)]
+
+    def set_dataframe(self, df, rows=None):
+        """Swap in a new DataFrame while the view keeps this model; rows limits the visible rows"""
+        self.beginResetModel()
+        self._df = df
+        self.highlight_patterns = []
+        self.duplicate_columns = []
+        self._dup_col_mask = np.zeros(df.shape[1], dtype=bool)
+        self._hl_mask = None
+        self.clear_cache()
+        if rows is not None:
+            # Filtered rows are shown through the row permutation, without slicing the DataFrame
+            self._row_perm = np.asarray(rows, dtype=np.intp)
+        self.endResetModel()
 
     def clear_cache(self):
-        """Clear all caches when data changes"""
-        self._cache.clear()
-        self._row_cache.clear()
-        self._column_cache.clear()
+        """Rebuild the cached cell and header arrays when data changes"""
+        self._values = self._df.to_numpy(copy=False)
+        self._columns = tuple(str(column) for column in self._df.columns)
+        self._row_perm = None
+
+    def _build_highlight_mask(self):
+        """Precompute which cells match any highlight pattern in a single pass"""
+        if not self.highlight_patterns or self._values.size == 0:
+            self._hl_mask = None
+            return
+        if len(self.highlight_patterns) == 1 and isinstance(self.highlight_patterns[0], re.Pattern):
+            # Already combined and compiled by the caller
+            combined = self.highlight_patterns[0]
+        else:
+            combined = re.compile("|".join(f"(?:{pattern})" for pattern in self.highlight_patterns))
+        # Only scan the visible rows, then place them at their rows in the full mask
+        rows = self._row_perm
+        values = self._values if rows is None else self._values[rows]
+        cells = pd.Series(values.ravel()).astype(str)
+        mask = cells.str.contains(combined, na=False).to_numpy(dtype=bool).reshape(values.shape)
+        if rows is not None:
+            full_mask = np.zeros(self._values.shape, dtype=bool)
+            full_mask[rows] = mask
+            mask = full_mask
+        self._hl_mask = mask
+
+# -------------------- Supported Files --------------------
+SUPPORTED_EXTENSIONS = frozenset({'.csv', '.xls', '.xlsx', '.xlsm', '.xlsb'})
+MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB in bytes
+
+# -------------------- Excel Reading Helpers --------------------
+class ExcelWorkbook:
+    """An open workbook that is kept around so sheet switches don't reopen the file"""
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._excel_file = None
+        self._engine = None
+        # Sheet threads may still be reading when the GUI closes the workbook
+        self._lock = threading.Lock()
+        self._readers = 0
+        self._close_requested = False
+        if CALAMINE_AVAILABLE:
+            try:
+                self._excel_file = pd.ExcelFile(file_path, engine="calamine")
+                self._engine = "calamine"
+            except Exception as e:
+                logger.warning(f"calamine could not read {file_path}, falling back to openpyxl: {str(e)}")
+        if self._excel_file is None:
+            self._open_openpyxl()
+
+    def _open_openpyxl(self):
+        # pandas opens openpyxl workbooks in read-only mode, which streams rows
+        self._excel_file = pd.ExcelFile(self.file_path, engine="openpyxl")
+        self._engine = "openpyxl"
+
+    def sheet_names(self):
+        """Return the sheet names without parsing any sheet data"""
+        return self._excel_file.sheet_names
+
+    def read_sheet(self, sheet_name=0):
+        """Read one sheet as an all-string DataFrame"""
+        with self._lock:
+            if self._close_requested:
+                raise ValueError(f"Workbook {self.file_path} is closed")
+            self._readers += 1
+        try:
+            return self._read_sheet(sheet_name)
+        finally:
+            with self._lock:
+                self._readers -= 1
+                close_now = self._close_requested and self._readers == 0
+            if close_now:
+                self._close_files()
+
+    def _parse(self, sheet_name):
+        return self._excel_file.parse(
+            sheet_name,
+            dtype=str,
+            na_filter=False,
+            keep_default_na=False
+        )
+
+    def _read_sheet(self, sheet_name):
+        if self._engine == "calamine":
+            try:
+                return self._parse(sheet_name)
+            except Exception as e:
+                logger.warning(f"calamine could not read {self.file_path}, falling back to openpyxl: {str(e)}")
+                self._excel_file.close()
+                self._excel_file = None
+                self._open_openpyxl()
+        return self._parse(sheet_name)
+
+    def close(self):
+        """Close the file now, or after the last read in progress finishes"""
+        with self._lock:
+            self._close_requested = True
+            if self._readers:
+                return
+        self._close_files()
+
+    def _close_files(self):
+        if self._excel_file is not None:
+            self._excel_file.close()
+            self._excel_file = None
 
 # -------------------- File Loader Thread (if needed) --------------------
 class FileLoaderThread(QThread):
@@ -272,72 +446,68 @@ class FileLoaderThread(QThread):
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"Initializing FileLoaderThread for file: {file_path}")
         self.file_path = file_path
-        self.chunk_size = 50000
+        self.chunk_size = 1024 * 1024  # Bytes per CSV read
         self.is_running = True
+        self.workbook = None
 
     def stop(self):
         self.is_running = False
         self.logger.info("FileLoaderThread stopped")
 
     def run(self):
+        import polars as pl
+        
+        loaded = False
         try:
             self.logger.info(f"Starting file load: {self.file_path}")
-            self.logger.debug(f"File size: {os.path.getsize(self.file_path) / (1024**2):.2f} MB")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"File size: {os.path.getsize(self.file_path) / (1024**2):.2f} MB")
             
-            if self.file_path.endswith(".csv"):
+            if os.path.splitext(self.file_path)[1].lower() == ".csv":
                 self.logger.info("Processing CSV file")
-                # Get total rows for progress calculation
-                total_rows = sum(1 for _ in open(self.file_path, 'r')) - 1  # Subtract header row
-                self.logger.info(f"Total rows in CSV: {total_rows}")
-                
-                # Read first chunk to get column names
-                df = pd.read_csv(self.file_path, nrows=1, dtype=str)
-                columns = df.columns
-                self.logger.info(f"CSV columns: {', '.join(columns)}")
                 
-                # Initialize empty DataFrame with correct columns
-                result_df = pd.DataFrame(columns=columns)
-                
-                # Read chunks and concatenate
-                for i in range(0, total_rows, self.chunk_size):
-                    if not self.is_running:
-                        self.logger.info("File loading interrupted")
-                        return
+                # Read the raw bytes in blocks so the progress bar tracks IO.
+                # Blocks are already large, so skip Python's own read buffer.
+                buffer = io.BytesIO()
+                with open(self.file_path, 'rb', buffering=0) as f:
+                    file_size = os.fstat(f.fileno()).st_size
+                    while True:
+                        if not self.is_running:
+                            self.logger.info("File loading interrupted")
+                            return
+                            
+                        block = f.read(self.chunk_size)
+                        if not block:
+                            break
+                        buffer.write(block)
                         
-                    chunk = pd.read_csv(
-                        self.file_path,
-                        skiprows=i + 1,  # Skip header row
-                        nrows=self.chunk_size,
-                        dtype=str,
-                        low_memory=False
-                    )
-                    
-                    result_df = pd.concat([result_df, chunk], ignore_index=True)
-                    
-                    # Update progress
-                    progress = min(100, int((i + self.chunk_size) / total_rows * 100))
-                    self.progress_updated.emit(progress)
-                    self.logger.debug(f"CSV loading progress: {progress}%")
+                        # Update progress
+                        progress = min(100, int(f.tell() / max(file_size, 1) * 100))
+                        self.progress_updated.emit(progress)
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(f"CSV loading progress: {progress}%")
+                
+                # Parse everything in one pass with Polars, keeping all columns as strings
+                buffer.seek(0)
+                result_df = pl.read_csv(
+                    buffer,
+                    infer_schema_length=0,
+                    missing_utf8_is_empty_string=True
+                ).to_pandas()
+                self.logger.info(f"CSV columns: {', '.join(result_df.columns)}")
                     
             else:
                 self.logger.info("Processing Excel file")
                 # For Excel files, first get sheet names
-                excel_file = pd.ExcelFile(self.file_path, engine="openpyxl")
-                sheet_names = excel_file.sheet_names
+                self.workbook = ExcelWorkbook(self.file_path)
+                sheet_names = self.workbook.sheet_names()
                 self.logger.info(f"Excel sheets found: {', '.join(sheet_names)}")
                 
                 # Emit sheet names first
                 self.sheet_names_loaded.emit(sheet_names)
                 
                 # Read the first sheet by default
-                result_df = pd.read_excel(
-                    self.file_path,
-                    sheet_name=0,
-                    engine="openpyxl",
-                    dtype=str,
-                    na_filter=False,
-                    keep_default_na=False
-                )
+                result_df = self.workbook.read_sheet(0)
                 
                 # Update progress for Excel
                 self.progress_updated.emit(100)
@@ -362,12 +532,13 @@ class FileLoaderThread(QThread):
             # Log success
             self.logger.info(f"File loaded successfully: {self.file_path}")
             self.logger.info(f"DataFrame shape: {result_df.shape}")
+            loaded = True
             self.data_loaded.emit(result_df, self.file_path)
 
-        except pd.errors.EmptyDataError:
+        except (pd.errors.EmptyDataError, pl.exceptions.NoDataError):
             self.logger.error("Empty file encountered")
             self.error_occurred.emit("The file is empty")
-        except pd.errors.ParserError as e:
+        except (pd.errors.ParserError, pl.exceptions.ComputeError) as e:
             self.logger.error(f"Parser error: {str(e)}")
             self.error_occurred.emit("Failed to parse the file. It may be corrupted or in an invalid format.")
         except PermissionError:
@@ -376,6 +547,235 @@ class FileLoaderThread(QThread):
         except Exception as e:
             self.logger.error(f"Unexpected error during file loading: {str(e)}", exc_info=True)
             self.error_occurred.emit(f"Error loading file: {str(e)}")
+        finally:
+            # The open workbook is only handed to the GUI after a successful load
+            if self.workbook is not None and not loaded:
+                self.workbook.close()
+                self.workbook = None
+
+class SheetLoaderThread(QThread):
+    sheet_loaded = pyqtSignal(pd.DataFrame, str)
+    error_occurred = pyqtSignal(str, str)
+
+    def __init__(self, workbook, sheet_name, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.workbook = workbook
+        self.file_path = workbook.file_path
+        self.sheet_name = sheet_name
+
+    def run(self):
+        try:
+            self.logger.info(f"Loading sheet '{self.sheet_name}' from {self.file_path}")
+            df = self.workbook.read_sheet(self.sheet_name)
+            self.sheet_loaded.emit(df, self.sheet_name)
+        except Exception as e:
+            self.logger.error(f"Error loading sheet '{self.sheet_name}': {str(e)}", exc_info=True)
+            self.error_occurred.emit(self.sheet_name, str(e))
+
+def find_duplicate_groups(df, columns):
+    """Return (duplicate row mask, group sizes) for the given columns from one grouping pass"""
+    if len(columns) == 1:
+        # One hash pass over a single column; NaN counts as a value like duplicated() does
+        group_ids, _ = pd.factorize(df[columns[0]], use_na_sentinel=False)
+    else:
+        group_ids = df.groupby(list(columns), sort=False, dropna=False).ngroup().to_numpy()
+    counts = np.bincount(group_ids)
+    return counts[group_ids] > 1, counts
+
+class DuplicateFinderThread(QThread):
+    duplicates_found = pyqtSignal(object, object)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, df, columns):
+        super().__init__()
+        self.logger = logging.getLogger(__name__)
+        self.df = df
+        self.columns = tuple(columns)
+
+    def run(self):
+        try:
+            mask, counts = find_duplicate_groups(self.df, self.columns)
+            self.duplicates_found.emit(mask, counts)
+        except Exception as e:
+            self.logger.error(f"Error finding duplicates: {str(e)}", exc_info=True)
+            self.error_occurred.emit(str(e))
+
+def build_search_cells(df):
+    """Return every cell of df as one flat Arrow string Series in row-major order"""
+    # Arrow-backed strings run lower/contains/== as vectorized compute kernels
+    return pd.Series(df.to_numpy().ravel()).astype(str).astype("string[pyarrow]")
+
+class SearchCacheThread(QThread):
+    cache_ready = pyqtSignal(object, object)
+
+    def __init__(self, df, parent=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.df = df
+
+    def run(self):
+        try:
+            cells = build_search_cells(self.df)
+            self.cache_ready.emit(cells, cells.str.lower())
+        except Exception as e:
+            self.logger.error(f"Error preparing search cache: {str(e)}", exc_info=True)
+
+def column_text_widths(df):
+    """Return the longest text length per column, header included, from one flat pass"""
+    header_lengths = np.array([len(str(column)) for column in df.columns], dtype=np.int64)
+    if df.empty:
+        return header_lengths
+    cell_lengths = build_search_cells(df).str.len().to_numpy(dtype=np.int64).reshape(df.shape)
+    return np.maximum(header_lengths, cell_lengths.max(axis=0))
+
+def write_export_file(export_df, file_name):
+    """Write export_df in the format implied by file_name and return that format's name"""
+    # Process export based on file type
+    if file_name.endswith(".csv"):
+        # Polars' native CSV writer is much faster than DataFrame.to_csv
+        import polars as pl
+        pl.DataFrame({
+            str(column): export_df[column].to_numpy() for column in export_df.columns
+        }).write_csv(file_name)
+        return "CSV"
+
+    elif file_name.endswith(".parquet"):
+        export_df.to_parquet(file_name, engine="pyarrow", compression="zstd", index=False)
+        return "Parquet"
+
+    elif file_name.endswith(".feather"):
+        # Feather only stores a default RangeIndex
+        export_df.reset_index(drop=True).to_feather(file_name, compression="lz4")
+        return "Feather"
+
+    elif file_name.endswith(".json"):
+        if ORJSON_AVAILABLE:
+            import orjson
+            with open(file_name, 'wb') as f:
+                f.write(orjson.dumps(
+                    export_df.to_dict(orient="records"),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            export_df.to_json(file_name, orient="records", indent=4, force_ascii=False)
+        return "JSON"
+
+    elif file_name.endswith(".pdf"):
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import letter, landscape
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
+
+        # Create PDF document
+        doc = SimpleDocTemplate(
+            file_name,
+            pagesize=landscape(letter),
+            rightMargin=30,
+            leftMargin=30,
+            topMargin=30,
+            bottomMargin=30
+        )
+
+        # Container for the 'Flowable' objects
+        elements = []
+
+        # Add title
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=getSampleStyleSheet()['Heading1'],
+            fontSize=16,
+            spaceAfter=30
+        )
+        elements.append(Paragraph("Data Export Report", title_style))
+
+        # Headers; rows are read per table below instead of converting the whole frame
+        header = export_df.columns.tolist()
+
+        # Fixed column widths, proportional to the longest text and fitted to
+        # the page, so reportlab doesn't auto-size every table
+        text_lengths = np.maximum(column_text_widths(export_df), 1)
+        col_widths = (doc.width * text_lengths / text_lengths.sum()).tolist()
+
+        # Add style to table
+        style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ])
+
+        # One table per 500 rows keeps reportlab's layout work linear
+        rows_per_table = 500
+        rows = export_df.itertuples(index=False, name=None)
+        chunk = list(islice(rows, rows_per_table))
+        while True:
+            table = Table([header] + chunk, colWidths=col_widths, repeatRows=1)
+            table.setStyle(style)
+            elements.append(table)
+            chunk = list(islice(rows, rows_per_table))
+            if not chunk:
+                break
+
+        # Build PDF
+        doc.build(elements)
+        return "PDF"
+
+    else:  # Excel files
+        import xlsxwriter
+        # constant_memory flushes each finished row instead of holding the whole sheet
+        workbook = xlsxwriter.Workbook(file_name, {'constant_memory': True})
+        try:
+            worksheet = workbook.add_worksheet("Filtered Results")
+
+            # Auto-adjust column widths
+            for col_num, max_length in enumerate(column_text_widths(export_df)):
+                worksheet.set_column(col_num, col_num, int(max_length) + 2)
+
+            # Add a header format
+            header_format = workbook.add_format({
+                'bold': True,
+                'bg_color': '#4B5563',
+                'font_color': 'white',
+                'border': 1
+            })
+            worksheet.write_row(0, 0, [str(value) for value in export_df.columns], header_format)
+
+            # Rows have to be written top to bottom in constant_memory mode
+            for row_num, row in enumerate(export_df.itertuples(index=False, name=None), start=1):
+                worksheet.write_row(row_num, 0, row)
+        finally:
+            workbook.close()
+
+        return "Excel"
+
+class ExportThread(QThread):
+    export_finished = pyqtSignal(str, str)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, export_df, file_name):
+        super().__init__()
+        self.logger = logging.getLogger(__name__)
+        self.export_df = export_df
+        self.file_name = file_name
+
+    def run(self):
+        try:
+            file_format = write_export_file(self.export_df, self.file_name)
+            self.export_finished.emit(self.file_name, file_format)
+        except Exception as e:
+            self.logger.error(f"Error exporting to {self.file_name}: {str(e)}", exc_info=True)
+            self.error_occurred.emit(str(e))
 
 # -------------------- Main Application Class --------------------
 class CSVSearchApp(QWidget):
@@ -384,128 +784,40 @@ class CSVSearchApp(QWidget):
         self.logger = logging.getLogger(__name__)
         self.logger.info("Initializing CSVSearchApp")
         self.df = None
+        self._df_str = None
+        self._df_str_lower = None
+        self._dup_key = None
+        self._dup_mask = None
+        self._dup_counts = None
+        self._match_stats = None
         self.last_loaded_path = ""
         self.loader_thread = None
+        self.duplicate_thread = None
+        self.export_thread = None
+        self._export_progress_dialog = None
+        self._export_dialog = None
+        self._export_column_model = None
+        self._export_columns = None
+        self._export_file_name = ""
+        self._workbook = None
+        self._sheet_cache = {}
         self.is_loading = False
+        # Set by code that keeps the window around after it is closed
+        self._persistent_mode = False
         self.initUI()
+        
+        # Coalesce the stats refreshes of quick successive sheet switches into one
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.setInterval(150)
+        self._stats_timer.timeout.connect(self.show_statistics)
         self.logger.info("CSVSearchApp initialization completed")
 
     def initUI(self):
-        # Define base styles
-        self.base_style = """
-            QWidget {
-                background-color: #f4f6f7;
-                color: #2d3436;
-            }
-            QLabel {
-                color: #2d3436;
-            }
-            QLineEdit, QComboBox {
-                background-color: #ffffff;
-                color: #2d3436;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                padding: 8px;
-                font-size: 14px;
-            }
-            QLineEdit:focus, QComboBox:focus {
-                border: 2px solid #007AFF;
-            }
-            QTableView {
-                background-color: #ffffff;
-                color: #2d3436;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                padding: 5px;
-            }
-            QHeaderView::section {
-                background-color: #007AFF;
-                color: #ffffff;
-                padding: 8px;
-                border: none;
-                border-radius: 8px;
-                font-weight: bold;
-            }
-            QCheckBox {
-                color: #2d3436;
-                font-size: 14px;
-                padding: 5px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-                border-radius: 4px;
-                border: 2px solid #dfe6e9;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #007AFF;
-                border: 2px solid #007AFF;
-            }
-            QPushButton {
-                background-color: #007AFF;
-                color: #ffffff;
-                border: 2px solid #007AFF;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #005ecb;
-                border: 2px solid #005ecb;
-            }
-            QPushButton:pressed {
-                background-color: #004BA0;
-                border: 2px solid #004BA0;
-            }
-            QScrollArea {
-                background-color: #ffffff;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background-color: #f4f6f7;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #007AFF;
-                border-radius: 5px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #005ecb;
-            }
-        """
-
-        button_style = """
-            QPushButton {
-                font-size: 14px;
-                font-weight: bold;
-                padding: 12px 24px;
-                border-radius: 8px;
-                border: 2px solid #007AFF;
-                background-color: #007AFF;
-                color: #ffffff;
-            }
-            QPushButton:hover {
-                background-color: #005ecb;
-                border: 2px solid #005ecb;
-            }
-            QPushButton:pressed {
-                background-color: #004BA0;
-                border: 2px solid #004BA0;
-            }
-        """
         self.setWindowTitle("CSV/Excel Search App")
         self.setGeometry(100, 100, 900, 600)
         self.setAcceptDrops(True)
-
-        self.setStyleSheet("""
-            background-color: #f4f6f7;
-            border-radius: 12px;
-        """)
+        self.setObjectName("mainWindow")  # Styles come from app.qss
 
         layout = QVBoxLayout()
         layout.setSpacing(10)
@@ -517,27 +829,7 @@ class CSVSearchApp(QWidget):
         # Add load/unload button to the left with adjusted size
         self.load_button = QPushButton("📂 Load", self)
         self.load_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.load_button.setStyleSheet("""
-            QPushButton {
-                font-size: 14px;
-                font-weight: bold;
-                padding: 15px 35px;
-                border-radius: 8px;
-                border: 2px solid #007AFF;
-                background-color: #007AFF;
-                color: #ffffff;
-                min-width: 80px;
-                max-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #005ecb;
-                border: 2px solid #005ecb;
-            }
-            QPushButton:pressed {
-                background-color: #004BA0;
-                border: 2px solid #004BA0;
-            }
-        """)
+        self.load_button.setObjectName("loadButton")
         self.load_button.clicked.connect(self.toggle_load_unload)
         file_status_layout.addWidget(self.load_button)
         
@@ -545,24 +837,14 @@ class CSVSearchApp(QWidget):
         self.file_name_label = QLabel("Please load a file to begin", self)
         self.file_name_label.setWordWrap(True)
         self.file_name_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.file_name_label.setStyleSheet("""
-            font-size: 16px;
-            color: #2d3436;
-            padding: 12px 20px;
-            font-weight: bold;
-        """)
+        self.file_name_label.setObjectName("fileNameLabel")
         file_status_layout.addWidget(self.file_name_label)
         
         # Status label with improved styling and word wrap
         self.status_label = QLabel("", self)
         self.status_label.setWordWrap(True)
         self.status_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.status_label.setStyleSheet("""
-            font-size: 14px;
-            color: #2d3436;
-            font-weight: bold;
-            padding: 12px 20px;
-        """)
+        self.status_label.setObjectName("statusLabel")
         file_status_layout.addWidget(self.status_label)
 
         layout.addLayout(file_status_layout)
@@ -579,36 +861,15 @@ class CSVSearchApp(QWidget):
         
         sheet_label = QLabel("Sheet:", self)
         sheet_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        sheet_label.setStyleSheet("font: bold 14px Arial;")
+        sheet_label.setObjectName("fieldLabel")
         sheet_layout.addWidget(sheet_label)
         
         self.sheet_selector = QComboBox(self)
         self.sheet_selector.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.sheet_selector.setStyleSheet("""
-            QComboBox {
-                background-color: #ffffff;
-                font-size: 14px;
-                padding: 8px;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                min-width: 200px;
-                selection-color: #007AFF;
-            }
-            QComboBox:hover {
-                border: 2px solid #007AFF;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #ffffff;
-                selection-background-color: #007AFF;
-                selection-color: #ffffff;
-                border: 1px solid #dfe6e9;
-                border-radius: 4px;
-            }
-            QComboBox QAbstractItemView::item {
-                padding: 5px;
-                min-height: 25px;
-            }
-        """)
+        self.sheet_selector.setObjectName("sheetSelector")
+        # String list models are refilled in one reset instead of item by item
+        self._sheet_model = QStringListModel(self)
+        self.sheet_selector.setModel(self._sheet_model)
         self.sheet_selector.setEnabled(False)
         self.sheet_selector.currentIndexChanged.connect(self.load_selected_sheet)
         sheet_layout.addWidget(self.sheet_selector)
@@ -622,37 +883,15 @@ class CSVSearchApp(QWidget):
         
         column_label = QLabel("Select Column:", self)
         column_label.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        column_label.setStyleSheet("font: bold 14px Arial;")
+        column_label.setObjectName("fieldLabel")
         column_layout.addWidget(column_label)
 
         self.column_selector = QComboBox(self)
         self.column_selector.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.column_selector.setEnabled(False)  # Initially disabled
-        self.column_selector.setStyleSheet("""
-            QComboBox {
-            background-color: #ffffff;
-                font-size: 14px;
-            padding: 8px;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                min-width: 200px;
-                selection-color: #007AFF;
-            }
-            QComboBox:hover {
-                border: 2px solid #007AFF;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #ffffff;
-                selection-background-color: #007AFF;
-                selection-color: #ffffff;
-            border: 1px solid #dfe6e9;
-                border-radius: 4px;
-            }
-            QComboBox QAbstractItemView::item {
-                padding: 5px;
-                min-height: 25px;
-            }
-        """)
+        self.column_selector.setObjectName("columnSelector")
+        self._column_model = QStringListModel(self)
+        self.column_selector.setModel(self._column_model)
         self.column_selector.currentIndexChanged.connect(self.update_selected_columns)
         column_layout.addWidget(self.column_selector)
         controls_layout.addWidget(column_container)
@@ -662,33 +901,14 @@ class CSVSearchApp(QWidget):
         # Add progress bar with improved styling
         self.progress_bar = QProgressBar(self)
         self.progress_bar.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                text-align: center;
-                background-color: #f4f6f7;
-                height: 20px;
-            }
-            QProgressBar::chunk {
-                background-color: #007AFF;
-                border-radius: 6px;
-            }
-        """)
+        self.progress_bar.setObjectName("loadProgressBar")
         self.progress_bar.hide()
         layout.addWidget(self.progress_bar)
 
         # Search section with improved layout and word wrap
         search_container = QWidget()
         search_container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        search_container.setStyleSheet("""
-            QWidget {
-            background-color: #ffffff;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        search_container.setObjectName("searchContainer")
         search_layout = QVBoxLayout(search_container)
         search_layout.setSpacing(15)
 
@@ -702,25 +922,13 @@ class CSVSearchApp(QWidget):
         search_box1_layout = QHBoxLayout(search_box1_container)
         search_box1_label = QLabel("First Query:", self)
         search_box1_label.setWordWrap(True)
-        search_box1_label.setStyleSheet("font: bold 14px Arial;")
+        search_box1_label.setObjectName("fieldLabel")
         search_box1_layout.addWidget(search_box1_label)
         
         self.search_box1 = QLineEdit(self)
         self.search_box1.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.search_box1.setPlaceholderText("Enter first query")
-        self.search_box1.setStyleSheet("""
-            QLineEdit {
-            background-color: #ffffff;
-            font-size: 14px;
-                padding: 10px;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                min-width: 200px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #007AFF;
-            }
-        """)
+        self.search_box1.setObjectName("searchBox")
         search_box1_layout.addWidget(self.search_box1)
         search_inputs.addWidget(search_box1_container)
 
@@ -730,26 +938,13 @@ class CSVSearchApp(QWidget):
         logic_layout = QHBoxLayout(logic_container)
         logic_label = QLabel("Logic:", self)
         logic_label.setWordWrap(True)
-        logic_label.setStyleSheet("font: bold 14px Arial;")
+        logic_label.setObjectName("fieldLabel")
         logic_layout.addWidget(logic_label)
 
         self.logic_selector = QComboBox(self)
         self.logic_selector.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
         self.logic_selector.addItems(["AND", "OR", "NOT"])
-        self.logic_selector.setStyleSheet("""
-            QComboBox {
-            background-color: #ffffff;
-            font-size: 14px;
-                padding: 10px;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                min-width: 100px;
-                selection-color: #007AFF;
-            }
-            QComboBox:hover {
-                border: 2px solid #007AFF;
-            }
-        """)
+        self.logic_selector.setObjectName("logicSelector")
         logic_layout.addWidget(self.logic_selector)
         search_inputs.addWidget(logic_container)
 
@@ -759,25 +954,13 @@ class CSVSearchApp(QWidget):
         search_box2_layout = QHBoxLayout(search_box2_container)
         search_box2_label = QLabel("Second Query:", self)
         search_box2_label.setWordWrap(True)
-        search_box2_label.setStyleSheet("font: bold 14px Arial;")
+        search_box2_label.setObjectName("fieldLabel")
         search_box2_layout.addWidget(search_box2_label)
 
         self.search_box2 = QLineEdit(self)
         self.search_box2.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.search_box2.setPlaceholderText("Enter second query")
-        self.search_box2.setStyleSheet("""
-            QLineEdit {
-            background-color: #ffffff;
-            font-size: 14px;
-                padding: 10px;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                min-width: 200px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #007AFF;
-            }
-        """)
+        self.search_box2.setObjectName("searchBox")
         search_box2_layout.addWidget(self.search_box2)
         search_inputs.addWidget(search_box2_container)
 
@@ -789,101 +972,39 @@ class CSVSearchApp(QWidget):
         
         # Create a container for checkboxes
         checkbox_container = QWidget()
-        checkbox_container.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
+        checkbox_container.setObjectName("checkboxContainer")
         checkbox_layout = QHBoxLayout(checkbox_container)
         checkbox_layout.setSpacing(20)
         
         self.match_case_checkbox = QCheckBox("Match Case", self)
         self.match_case_checkbox.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.match_case_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 14px;
-                color: #2d3436;
-                padding: 8px;
-                spacing: 12px;
-                background-color: transparent;
-            }
-            QCheckBox::indicator {
-                width: 22px;
-                height: 22px;
-                border-radius: 4px;
-                border: 2px solid #dfe6e9;
-            }
-            QCheckBox::indicator:hover {
-                border: 2px solid #007AFF;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #007AFF;
-                border: 2px solid #007AFF;
-            }
-            QCheckBox::indicator:checked:hover {
-                background-color: #005ecb;
-            }
-        """)
+        self.match_case_checkbox.setObjectName("optionCheckbox")
         checkbox_layout.addWidget(self.match_case_checkbox)
         
         self.entire_field_checkbox = QCheckBox("Entire Field", self)
         self.entire_field_checkbox.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.entire_field_checkbox.setStyleSheet("""
-            QCheckBox {
-                font-size: 14px;
-                color: #2d3436;
-                padding: 8px;
-                spacing: 12px;
-                background-color: transparent;
-            }
-            QCheckBox::indicator {
-                width: 22px;
-                height: 22px;
-                border-radius: 4px;
-                border: 2px solid #dfe6e9;
-            }
-            QCheckBox::indicator:hover {
-                border: 2px solid #007AFF;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #007AFF;
-                border: 2px solid #007AFF;
-            }
-            QCheckBox::indicator:checked:hover {
-                background-color: #005ecb;
-            }
-        """)
+        self.entire_field_checkbox.setObjectName("optionCheckbox")
         checkbox_layout.addWidget(self.entire_field_checkbox)
         
         search_options.addWidget(checkbox_container)
         
         # Add search buttons container
         search_buttons_container = QWidget()
-        search_buttons_container.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
+        search_buttons_container.setObjectName("searchButtonsContainer")
         search_buttons_layout = QHBoxLayout(search_buttons_container)
         search_buttons_layout.setSpacing(10)
         
         # Add Find Matches button
         self.search_button = QPushButton("🔍 Find Matches", self)
         self.search_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.search_button.setStyleSheet(button_style)
+        self.search_button.setObjectName("primaryButton")
         self.search_button.clicked.connect(self.search_data)
         search_buttons_layout.addWidget(self.search_button)
         
         # Add Clear Search button
         self.reset_search_button = QPushButton("🔄 Clear Search", self)
         self.reset_search_button.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.reset_search_button.setStyleSheet(button_style)
+        self.reset_search_button.setObjectName("primaryButton")
         self.reset_search_button.clicked.connect(self.reset_search)
         search_buttons_layout.addWidget(self.reset_search_button)
         
@@ -894,14 +1015,7 @@ class CSVSearchApp(QWidget):
         # Button Layout with improved organization
         button_container = QWidget()
         button_container.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        button_container.setStyleSheet("""
-            QWidget {
-                background-color: #ffffff;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        button_container.setObjectName("buttonContainer")
         button_layout = QVBoxLayout(button_container)
         button_layout.setSpacing(15)
 
@@ -911,13 +1025,13 @@ class CSVSearchApp(QWidget):
         
         self.highlight_duplicates_button = QPushButton("🔍 Find Duplicates", self)
         self.highlight_duplicates_button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.highlight_duplicates_button.setStyleSheet(button_style)
+        self.highlight_duplicates_button.setObjectName("primaryButton")
         self.highlight_duplicates_button.clicked.connect(self.highlight_duplicates)
         row1.addWidget(self.highlight_duplicates_button)
         
         self.refresh_button = QPushButton("🔄 Reload File", self)
         self.refresh_button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.refresh_button.setStyleSheet(button_style)
+        self.refresh_button.setObjectName("primaryButton")
         self.refresh_button.clicked.connect(self.refresh_data)
         row1.addWidget(self.refresh_button)
         
@@ -929,19 +1043,19 @@ class CSVSearchApp(QWidget):
         
         self.export_button = QPushButton("💾 Save As...", self)
         self.export_button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.export_button.setStyleSheet(button_style)
+        self.export_button.setObjectName("primaryButton")
         self.export_button.clicked.connect(self.export_data)
         row2.addWidget(self.export_button)
         
         self.stats_button = QPushButton("📊 Show Statistics", self)
         self.stats_button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.stats_button.setStyleSheet(button_style)
+        self.stats_button.setObjectName("primaryButton")
         self.stats_button.clicked.connect(self.show_statistics)
         row2.addWidget(self.stats_button)
         
         self.visualize_button = QPushButton("📈 Create Chart", self)
         self.visualize_button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.visualize_button.setStyleSheet(button_style)
+        self.visualize_button.setObjectName("primaryButton")
         self.visualize_button.clicked.connect(self.show_visualization)
         row2.addWidget(self.visualize_button)
         button_layout.addLayout(row2)
@@ -952,54 +1066,32 @@ class CSVSearchApp(QWidget):
         self.stats_panel = QLabel("📊 Stats Panel", self)
         self.stats_panel.setWordWrap(False)  # Disable word wrap
         self.stats_panel.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.stats_panel.setStyleSheet("""
-            font-size: 14px;
-            color: #2d3436;
-            font-weight: bold;
-            padding: 12px 20px;
-            background-color: #ffffff;
-            border: 2px solid #dfe6e9;
-            border-radius: 8px;
-        """)
+        self.stats_panel.setObjectName("statsPanel")
         layout.addWidget(self.stats_panel, alignment=Qt.AlignmentFlag.AlignRight)
 
         # Table view with improved styling
         self.table = QTableView(self)
         self.table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        # Uniform row heights: Qt never has to ask for per-row geometry
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
         self.table.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        # Fixed default widths; only the visible region is ever measured for auto-fit
+        self.table.horizontalHeader().setDefaultSectionSize(140)
+        self.table.horizontalHeader().setResizeContentsPrecision(0)
         self.table.setSizeAdjustPolicy(QAbstractScrollArea.SizeAdjustPolicy.AdjustIgnored)
-        self.table.setStyleSheet("""
-            QTableView {
-                font-size: 14px;
-                background-color: #ffffff;
-                border: 2px solid #dfe6e9;
-                border-radius: 8px;
-                padding: 5px;
-            }
-            QHeaderView::section {
-                background-color: #007AFF;
-                color: #ffffff;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px;
-                border-radius: 8px;
-            }
-        """)
+        self.table.setObjectName("dataTable")
+        # One model for the lifetime of the view; display_data swaps its DataFrame
+        self.table_model = PandasTableModel(pd.DataFrame())
+        self.table.setModel(self.table_model)
         layout.addWidget(self.table)
 
         # Footer with improved styling and word wrap
         self.footer_label = QLabel("Developed by Jayakumar Sadhasivam - jayakumars.in\niamjayakumars@gmail.com", self)
         self.footer_label.setWordWrap(True)
         self.footer_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.footer_label.setStyleSheet("""
-            font-size: 12px;
-            color: #2d3436;
-            padding: 10px;
-            text-align: center;
-            font-weight: bold;
-        """)
+        self.footer_label.setObjectName("footerLabel")
         self.footer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.footer_label)
  
@@ -1021,14 +1113,14 @@ class CSVSearchApp(QWidget):
         if file_path:
             try:
                 # Validate file extension
-                if not any(file_path.lower().endswith(ext) for ext in ['.csv', '.xls', '.xlsx', '.xlsm', '.xlsb']):
+                if os.path.splitext(file_path)[1].lower() not in SUPPORTED_EXTENSIONS:
                     self.logger.warning(f"Invalid file extension: {file_path}")
                     QMessageBox.warning(self, "Invalid File", "Please select a valid CSV or Excel file.")
                     return
                 
                 # Check file size (100MB limit)
-                file_size = os.path.getsize(file_path)
-                if file_size > 100 * 1024 * 1024:  # 100MB in bytes
+                file_size = os.stat(file_path).st_size
+                if file_size > MAX_FILE_SIZE:
                     self.logger.warning(f"File too large: {file_size / (1024*1024):.2f}MB")
                     QMessageBox.warning(self, "File Too Large", "File size exceeds 100MB limit.")
                     return
@@ -1042,8 +1134,10 @@ class CSVSearchApp(QWidget):
                 self.logger.info(f"Starting file load process: {file_path}")
                 self.is_loading = True
                 self.last_loaded_path = file_path
+                self._sheet_cache = {}
+                self._close_workbook()
                 self.status_label.setText("Loading file... Please wait.")
-                self.df = None  # Clear previous data
+                self._set_df(None)  # Clear previous data
                 
                 # Show progress bar
                 self.progress_bar.setValue(0)
@@ -1105,8 +1199,10 @@ class CSVSearchApp(QWidget):
             self.status_label.setText("❌ File loading failed")
             
         # Reset UI state
-        self.df = None
+        self._set_df(None)
         self.last_loaded_path = ""
+        self._sheet_cache = {}
+        self._close_workbook()
         self.file_name_label.setText("No file loaded")
         self.selected_columns = []
         self.sheet_selector.clear()
@@ -1123,104 +1219,126 @@ class CSVSearchApp(QWidget):
             self.status_label.setText("⚠️ No sheets found in the file")
             return
             
-        # Disconnect the signal temporarily to prevent triggering load_selected_sheet
-        try:
-            self.sheet_selector.currentIndexChanged.disconnect(self.load_selected_sheet)
-        except:
-            pass  # Signal might not be connected yet
-        
-        # Update the sheet selector
-        self.sheet_selector.clear()
-        
         # Validate and clean sheet names
         valid_sheets = []
+        invalid_count = 0
         for sheet in sheet_names:
             if isinstance(sheet, str) and sheet.strip():
                 valid_sheets.append(sheet.strip())
             else:
-                self.status_label.setText("⚠️ Some sheet names were invalid and were skipped")
+                invalid_count += 1
         
+        # Block signals so refilling the selector doesn't trigger load_selected_sheet
+        with QSignalBlocker(self.sheet_selector):
+            self._sheet_model.setStringList(valid_sheets)
+            if valid_sheets:
+                self.sheet_selector.setCurrentIndex(0)
+            self.sheet_selector.setEnabled(bool(valid_sheets))
+        
+        # One status update once the selector is filled
         if valid_sheets:
-            self.sheet_selector.addItems(valid_sheets)
-            self.sheet_selector.setEnabled(True)
-            self.sheet_selector.setCurrentIndex(0)
-            self.status_label.setText(f"✅ Found {len(valid_sheets)} valid sheets")
-            
-            # Load the first sheet automatically
-            self.load_selected_sheet()
+            status = f"✅ Found {len(valid_sheets)} valid sheets"
+            if invalid_count:
+                status += f" ({invalid_count} invalid sheet names skipped)"
+            self.status_label.setText(status)
+            # The loader thread parses the first sheet and delivers it via on_file_loaded
         else:
-            self.sheet_selector.setEnabled(False)
             self.status_label.setText("❌ No valid sheets found")
-        
-        # Reconnect the signal
-        self.sheet_selector.currentIndexChanged.connect(self.load_selected_sheet)
 
     def load_selected_sheet(self):
-        if not self.last_loaded_path:
+        if not self.last_loaded_path or self._workbook is None:
             return
             
         if self.sheet_selector.currentIndex() < 0:
             return
             
-            sheet_name = str(self.sheet_selector.currentText()).strip()
+        sheet_name = str(self.sheet_selector.currentText()).strip()
         if not sheet_name:
-                return
+            return
         
-        try:
-            # Read the selected sheet
-            df = pd.read_excel(
-                self.last_loaded_path,
-                sheet_name=sheet_name,
-                engine="openpyxl",
-                dtype=str,
-                na_filter=False,
-                keep_default_na=False
-            )
-            
-            if df.empty:
-                self.status_label.setText(f"⚠️ Sheet '{sheet_name}' is empty")
-                return
-            
-            # Update the data and UI
-            self.df = df
-            self.file_name_label.setText(f"📂 {os.path.basename(self.last_loaded_path)} - {sheet_name}")
-            
-            # Update column selector
-            self.column_selector.clear()
-            self.column_selector.addItems(self.df.columns)
-            self.column_selector.setCurrentIndex(0)
-            
-            self.selected_columns = [self.df.columns[0]]
-            self.status_label.setText(f"✅ Sheet loaded successfully: {sheet_name}")
-            
-            # Clear any existing highlights or filters
-            if isinstance(self.table.model(), PandasTableModel):
-                self.table.model().set_highlight_patterns([])
-                self.table.model().set_duplicate_columns([])
-            
-            # Display the new data
-            self.display_data(self.df)
-            
-            # Update statistics
-            self.show_statistics()
-            
-        except Exception as e:
-            self.logger.error(f"Error loading sheet '{sheet_name}': {str(e)}", exc_info=True)
-            self.status_label.setText(f"❌ Failed to load sheet '{sheet_name}'")
+        # Sheets parsed earlier for this file switch instantly
+        if sheet_name in self._sheet_cache:
+            self.show_sheet(self._sheet_cache[sheet_name], sheet_name)
+            return
+        
+        # Parse the sheet off the GUI thread; the selector stays disabled until it arrives
+        self.sheet_selector.setEnabled(False)
+        self.status_label.setText(f"Loading sheet '{sheet_name}'... Please wait.")
+        # Parented to the window so a superseded thread can finish on its own
+        sheet_thread = SheetLoaderThread(self._workbook, sheet_name, self)
+        sheet_thread.sheet_loaded.connect(self.on_sheet_loaded)
+        sheet_thread.error_occurred.connect(self.handle_sheet_error)
+        sheet_thread.finished.connect(sheet_thread.deleteLater)
+        sheet_thread.start()
+
+    def _is_current_sheet_thread(self):
+        """Whether the emitting sheet thread read from the workbook that is still open"""
+        sender = self.sender()
+        return sender is not None and self._workbook is not None and sender.workbook is self._workbook
+
+    def on_sheet_loaded(self, df, sheet_name):
+        # Drop results for a file that was unloaded or replaced meanwhile
+        if not self._is_current_sheet_thread():
+            return
+        self.sheet_selector.setEnabled(True)
+        self._sheet_cache[sheet_name] = df
+        self.show_sheet(df, sheet_name)
+
+    def handle_sheet_error(self, sheet_name, error_message):
+        if not self._is_current_sheet_thread():
+            return
+        self.sheet_selector.setEnabled(True)
+        self.status_label.setText(f"❌ Failed to load sheet '{sheet_name}'")
+
+    def _close_workbook(self):
+        """Release the workbook kept open for sheet switching"""
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+
+    def show_sheet(self, df, sheet_name):
+        """Make an already parsed sheet the current data"""
+        if df.empty:
+            self.status_label.setText(f"⚠️ Sheet '{sheet_name}' is empty")
+            return
+        
+        # Update the data and UI
+        self._set_df(df)
+        self._prepare_search_cells()
+        self.file_name_label.setText(f"📂 {os.path.basename(self.last_loaded_path)} - {sheet_name}")
+        
+        # Update column selector
+        self._column_model.setStringList([str(column) for column in self.df.columns])
+        self.column_selector.setCurrentIndex(0)
+        
+        self.selected_columns = [self.df.columns[0]]
+        self.status_label.setText(f"✅ Sheet loaded successfully: {sheet_name}")
+        
+        # Display the new data; the model reset clears any highlights
+        self.display_data(self.df)
+        
+        # Update statistics once sheet switching settles
+        self._stats_timer.start()
 
     def on_file_loaded(self, df, file_path):
+        self.is_loading = False
         self.progress_bar.hide()
         if df is None or df.empty:
             QMessageBox.warning(self, "Error", "File is empty or failed to load.")
             return
             
+        # Excel loads deliver the first sheet and the open workbook; keep both for sheet switches
+        self._workbook = self.loader_thread.workbook
+        if self.sheet_selector.count() > 0:
+            self._sheet_cache[self.sheet_selector.itemText(0)] = df
+            
         # Update the data and UI
-        self.df = df
+        self._set_df(df)
+        self._prepare_search_cells()
         self.file_name_label.setText(f"📂 {file_path.split('/')[-1]}")
         
         # Update column selector
-        self.column_selector.clear()
-        self.column_selector.addItems(self.df.columns)
+        self._column_model.setStringList([str(column) for column in self.df.columns])
         self.column_selector.setCurrentIndex(0)  # Select first column by default
         self.column_selector.setEnabled(True)  # Enable the selector
         
@@ -1254,8 +1372,10 @@ class CSVSearchApp(QWidget):
     def toggle_load_unload(self):
         if self.df is not None:
             # If file is loaded, unload it
-            self.df = None
+            self._set_df(None)
             self.last_loaded_path = ""
+            self._sheet_cache = {}
+            self._close_workbook()
             self.is_loading = False
             
             # Reset UI elements
@@ -1301,16 +1421,22 @@ class CSVSearchApp(QWidget):
             self.entire_field_checkbox.setChecked(False)
             
             # Clear any highlights
-            if isinstance(self.table.model(), PandasTableModel):
-                self.table.model().set_highlight_patterns([])
-                self.table.model().set_duplicate_columns([])
+            self.table_model.set_highlight_patterns([])
+            self.table_model.set_duplicate_columns([])
             
             # Show all data
             self.display_data(self.df)
+            self._set_status_alert(False)
             self.status_label.setText("✅ Search cleared, showing all data")
         else:
             self.status_label.setText("⚠️ No data available")
 
+    def _set_status_alert(self, alert):
+        """Toggle the alert look of the status label defined in app.qss"""
+        self.status_label.setProperty("alert", alert)
+        self.status_label.style().unpolish(self.status_label)
+        self.status_label.style().polish(self.status_label)
+
     def highlight_duplicates(self):
         if self.df is None:
             QMessageBox.warning(self, "Error", "No data available.")
@@ -1320,9 +1446,44 @@ class CSVSearchApp(QWidget):
             QMessageBox.warning(self, "Error", "Please select at least one column to highlight duplicates.")
             return
 
-        # Find duplicates across selected columns
-        duplicates = self.df[self.df.duplicated(subset=self.selected_columns, keep=False)]
-        if duplicates.empty:
+        # Small frames and cached results are handled inline; large frames are
+        # grouped on a worker thread so the window stays responsive
+        if self._dup_key == tuple(self.selected_columns) or len(self.df) < 50000:
+            self.show_duplicates()
+            return
+
+        self.highlight_duplicates_button.setEnabled(False)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.show()
+        self.status_label.setText("Finding duplicates... Please wait.")
+        self.duplicate_thread = DuplicateFinderThread(self.df, self.selected_columns)
+        self.duplicate_thread.duplicates_found.connect(self.on_duplicates_found)
+        self.duplicate_thread.error_occurred.connect(self.handle_duplicate_error)
+        self.duplicate_thread.start()
+
+    def _finish_duplicate_search(self):
+        self.highlight_duplicates_button.setEnabled(True)
+        self.progress_bar.hide()
+        self.progress_bar.setRange(0, 100)
+
+    def on_duplicates_found(self, mask, counts):
+        self._finish_duplicate_search()
+        # Ignore results for data or a column selection that changed meanwhile
+        if self.duplicate_thread.df is not self.df or self.duplicate_thread.columns != tuple(self.selected_columns):
+            return
+        self._dup_mask = mask
+        self._dup_counts = counts
+        self._dup_key = self.duplicate_thread.columns
+        self.show_duplicates()
+
+    def handle_duplicate_error(self, error_message):
+        self._finish_duplicate_search()
+        QMessageBox.warning(self, "Error", f"Failed to find duplicates:\n{error_message}")
+
+    def show_duplicates(self):
+        """Highlight the selected columns and report the duplicate count"""
+        duplicate_count, unique_count = self._get_duplicate_stats()
+        if duplicate_count == 0:
             QMessageBox.information(self, "Info", "No duplicates found in the selected columns.")
             return
 
@@ -1333,36 +1494,24 @@ class CSVSearchApp(QWidget):
         self.display_data(self.df)
         
         # Set duplicate highlighting
-        if isinstance(self.table.model(), PandasTableModel):
-            self.table.model().set_duplicate_columns(column_indices)
+        self.table_model.set_duplicate_columns(column_indices)
             
-        # Update status with duplicate count
-        duplicate_count = len(duplicates)
-        unique_count = len(self.df[self.selected_columns].drop_duplicates())
-        
         # Set status label with custom styling for duplicate count
-        self.status_label.setStyleSheet("""
-            font-size: 18px;
-            color: #FF3B30;
-            font-weight: bold;
-            padding: 12px 20px;
-            background-color: #ffffff;
-            border: 2px solid #FF3B30;
-            border-radius: 8px;
-        """)
+        self._set_status_alert(True)
         self.status_label.setText(f"Found {duplicate_count} duplicate entries in selected columns")
         
         # Update statistics
         self.show_statistics()
 
-    def display_data(self, df):
-        if df is None or df.empty:
-            self.table.setModel(None)
+    def display_data(self, df, rows=None):
+        """Show df in the table, limited to the given row positions when rows is set"""
+        if df is None or df.empty or (rows is not None and len(rows) == 0):
+            self.table_model.set_dataframe(pd.DataFrame())
             self.status_label.setText("No data to display.")
             return
 
         # Update status first with detailed stats
-        total_rows = df.shape[0]
+        total_rows = df.shape[0] if rows is None else len(rows)
         total_columns = df.shape[1]
         stats_text = f"📊 Total Rows: {total_rows} | Total Columns: {total_columns}"
         self.status_label.setText(stats_text)
@@ -1370,17 +1519,24 @@ class CSVSearchApp(QWidget):
         # Update stats panel with the same information
         self.stats_panel.setText(stats_text)
 
-        # Create and set the model
-        model = PandasTableModel(df)
-        self.table.setModel(model)
-        
-        # Enable interactive adjustment and sorting
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        # Reset the existing model with sorting off, then re-apply the current sort
+        self.table.setSortingEnabled(False)
+        self.table_model.set_dataframe(df, rows)
         self.table.setSortingEnabled(True)
         
-        # Auto-resize columns
-        self.table.resizeColumnsToContents()
+        # Size columns from the header and a small sample instead of every cell
+        self._fit_column_widths(df, rows=rows)
+
+    def _fit_column_widths(self, df, sample_rows=50, max_width=400, rows=None):
+        """Set each column's width from its header and the first rows only"""
+        cell_metrics = self.table.fontMetrics()
+        header_metrics = self.table.horizontalHeader().fontMetrics()
+        sample = (df.iloc[:sample_rows] if rows is None else df.iloc[rows[:sample_rows]]).to_numpy()
+        for column, name in enumerate(df.columns):
+            width = header_metrics.horizontalAdvance(str(name))
+            for value in sample[:, column]:
+                width = max(width, cell_metrics.horizontalAdvance(str(value)))
+            self.table.setColumnWidth(column, min(width + 24, max_width))
 
     def show_statistics(self):
         if self.df is not None:
@@ -1388,26 +1544,30 @@ class CSVSearchApp(QWidget):
             query1 = self.search_box1.text().strip()
             query2 = self.search_box2.text().strip()
             
+            total_matches = 0
             if query1 or query2:
-                search_df = self.df.astype(str)
-                if not self.match_case_checkbox.isChecked():
-                    search_df = search_df.apply(lambda x: x.str.lower())
+                match_case = self.match_case_checkbox.isChecked()
+                if not match_case:
                     query1 = query1.lower()
                     query2 = query2.lower()
-                
-                yellow_highlights = search_df.apply(lambda x: x.str.contains(query1, na=False)).sum().sum()
-                green_highlights = search_df.apply(lambda x: x.str.contains(query2, na=False)).sum().sum()
-                total_matches = yellow_highlights + green_highlights
-            else:
-                total_matches = 0
+
+                # Reuse the counts from the last search when the options haven't changed
+                key = self._match_stats_key(query1, query2, match_case)
+                if self._match_stats is not None and self._match_stats[0] == key:
+                    total_matches = self._match_stats[1]
+                else:
+                    # One flat pass per query instead of one per column
+                    cells = self._get_search_cells(match_case)
+                    for query in (query1, query2):
+                        if query:
+                            total_matches += np.count_nonzero(self._match_cells(cells, query))
+                    self._match_stats = (key, total_matches)
 
             # Get duplicate statistics if columns are selected
             duplicate_stats = ""
             if self.selected_columns:
-                duplicates = self.df[self.df.duplicated(subset=self.selected_columns, keep=False)]
-                if not duplicates.empty:
-                    duplicate_count = len(duplicates)
-                    unique_count = len(self.df[self.selected_columns].drop_duplicates())
+                duplicate_count, unique_count = self._get_duplicate_stats()
+                if duplicate_count:
                     duplicate_stats = f" | Duplicates: {duplicate_count} | Unique Values: {unique_count}"
 
             # Update stats panel with all information
@@ -1417,320 +1577,229 @@ class CSVSearchApp(QWidget):
             stats_text += duplicate_stats
             self.stats_panel.setText(stats_text)
 
+    def _set_df(self, df):
+        """Replace the loaded DataFrame and drop the caches derived from it"""
+        self.df = df
+        self._df_str = None
+        self._df_str_lower = None
+        self._dup_key = None
+        self._dup_mask = None
+        self._dup_counts = None
+        self._match_stats = None
+
+    def _get_duplicate_stats(self):
+        """Return (duplicate rows, unique values) for the selected columns from one grouping pass"""
+        key = tuple(self.selected_columns)
+        if self._dup_key != key:
+            self._dup_mask, self._dup_counts = find_duplicate_groups(self.df, key)
+            self._dup_key = key
+        return int(self._dup_mask.sum()), len(self._dup_counts)
+
+    def _match_stats_key(self, query1, query2, match_case):
+        """Return the search options the cached match count depends on"""
+        return (query1, query2, match_case, self.entire_field_checkbox.isChecked())
+
+    def _match_cells(self, cells, query):
+        """Return a flat boolean mask of the cells matching query under the Entire Field option"""
+        if self.entire_field_checkbox.isChecked():
+            return (cells == query).to_numpy(dtype=bool)
+        return cells.str.contains(query, regex=False).to_numpy(dtype=bool)
+
+    def _prepare_search_cells(self):
+        """Build the flat and lowercased search views in the background after a load"""
+        # Parented to the window so a superseded thread can finish on its own
+        cache_thread = SearchCacheThread(self.df, self)
+        cache_thread.cache_ready.connect(self.on_search_cache_ready)
+        cache_thread.finished.connect(cache_thread.deleteLater)
+        cache_thread.start()
+
+    def on_search_cache_ready(self, cells, cells_lower):
+        # Keep whatever a search already built, and drop results for replaced data
+        if self.sender().df is not self.df:
+            return
+        if self._df_str is None:
+            self._df_str = cells
+        if self._df_str_lower is None:
+            self._df_str_lower = cells_lower
+
+    def _get_search_cells(self, match_case):
+        """Return every cell of self.df as one flat Arrow string Series, built once per DataFrame"""
+        if self._df_str is None:
+            self._df_str = build_search_cells(self.df)
+        if match_case:
+            return self._df_str
+        if self._df_str_lower is None:
+            self._df_str_lower = self._df_str.str.lower()
+        return self._df_str_lower
+
     def export_data(self):
         if self.df is None:
             QMessageBox.warning(self, "Error", "No data available to export.")
             return
-            
+
+        if self.export_thread and self.export_thread.isRunning():
+            QMessageBox.warning(self, "Warning", "An export is already running. Please wait.")
+            return
+
         try:
             self.logger.info("Starting export operation")
             file_name, _ = QFileDialog.getSaveFileName(
-                self, 
-                "Save File", 
-                "", 
-                "Excel Files (*.xlsx);;CSV Files (*.csv);;JSON Files (*.json);;PDF Files (*.pdf)"
+                self,
+                "Save File",
+                "",
+                "Excel Files (*.xlsx);;CSV Files (*.csv);;JSON Files (*.json);;PDF Files (*.pdf);;Parquet Files (*.parquet);;Feather Files (*.feather)"
             )
-            
+
             if not file_name:
                 return
-                
-            # Get selected rows or all rows
-            selected_rows = self.table.selectionModel().selectedRows()
-            selected_indexes = [index.row() for index in selected_rows] if selected_rows else range(self.df.shape[0])
-            export_df = self.df.iloc[selected_indexes].copy()  # Create a copy to avoid modifying original
-            
+            self._export_file_name = file_name
+
+            # Reuse the column selection dialog; checkboxes are rebuilt only when the columns change
+            dialog = self._get_export_dialog(list(self.df.columns))
+
+            # Show dialog
+            dialog.exec()
+
+        except Exception as e:
+            self.logger.error(f"Error in export_data: {str(e)}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Failed to export file:\n{str(e)}")
+
+    def _get_export_dialog(self, columns):
+        """Return the column selection dialog, built on first use and refilled when columns change"""
+        if self._export_dialog is None:
             # Create column selection dialog with improved UI
             dialog = QDialog(self)
             dialog.setWindowTitle("Select Columns to Export")
             dialog.setMinimumWidth(400)
             dialog.setMinimumHeight(500)
-            dialog.setStyleSheet("""
-                QDialog {
-                    background-color: #f4f6f7;
-                    border-radius: 10px;
-                }
-                QLabel {
-                    font-size: 14px;
-                    color: #2d3436;
-                    padding: 5px;
-                }
-                QPushButton {
-                    background-color: #007AFF;
-                    color: white;
-                    border: none;
-                    padding: 8px 15px;
-                    border-radius: 5px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #005ecb;
-                }
-                QPushButton:pressed {
-                    background-color: #004BA0;
-                }
-                QCheckBox {
-                    font-size: 13px;
-                    padding: 5px;
-                    color: #2d3436;
-                }
-                QCheckBox:hover {
-                    background-color: #e9ecef;
-                }
-                QScrollArea {
-                    border: 1px solid #dfe6e9;
-                    border-radius: 5px;
-                    background-color: white;
-                }
-            """)
-            
+            dialog.setObjectName("exportDialog")
+
             layout = QVBoxLayout()
             layout.setSpacing(10)
             layout.setContentsMargins(15, 15, 15, 15)
-            
+
             # Add header with instructions
             header_label = QLabel("Select columns to export:")
-            header_label.setStyleSheet("""
-                font-size: 16px;
-                font-weight: bold;
-                color: #2d3436;
-                padding: 10px;
-                background-color: #e9ecef;
-                border-radius: 5px;
-            """)
+            header_label.setObjectName("exportHeaderLabel")
             layout.addWidget(header_label)
-            
-            # Create scroll area for checkboxes
-            scroll = QScrollArea()
-            scroll.setWidgetResizable(True)
-            scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-            scroll_widget = QScrollWidget()
-            scroll_layout = QVBoxLayout(scroll_widget)
-            scroll_layout.setSpacing(5)
-            scroll_layout.setContentsMargins(10, 10, 10, 10)
-            
-            # Add checkboxes for each column
-            checkboxes = {}
-            for column in export_df.columns:
-                cb = QCheckBox(column)
-                cb.setChecked(True)  # Default to checked
-                checkboxes[column] = cb
-                scroll_layout.addWidget(cb)
-            
-            scroll.setWidget(scroll_widget)
-            layout.addWidget(scroll)
-            
+
+            # Checkable list of columns; the view only paints the visible rows
+            self._export_column_model = QStandardItemModel(dialog)
+            column_list = QListView()
+            column_list.setObjectName("exportColumnList")
+            column_list.setModel(self._export_column_model)
+            column_list.setUniformItemSizes(True)
+            column_list.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+            column_list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+            layout.addWidget(column_list)
+
             # Add button container with improved styling
             button_container = QWidget()
-            button_container.setStyleSheet("""
-                QWidget {
-                    background-color: #e9ecef;
-                    border-radius: 5px;
-                    padding: 10px;
-                }
-            """)
+            button_container.setObjectName("dialogButtonContainer")
             button_layout = QHBoxLayout(button_container)
             button_layout.setSpacing(10)
-            
+
             # Create buttons with icons
             select_all = QPushButton("✓ Select All")
             deselect_all = QPushButton("✗ Deselect All")
             export_button = QPushButton("💾 Export")
             cancel_button = QPushButton("❌ Cancel")
-            
+
             # Add buttons to layout
             button_layout.addWidget(select_all)
             button_layout.addWidget(deselect_all)
             button_layout.addWidget(export_button)
             button_layout.addWidget(cancel_button)
-            
+
             layout.addWidget(button_container)
             dialog.setLayout(layout)
-            
+
             # Connect button signals
-            def on_select_all():
-                for cb in checkboxes.values():
-                    cb.setChecked(True)
-                    
-            def on_deselect_all():
-                for cb in checkboxes.values():
-                    cb.setChecked(False)
-                    
-            def on_export():
-                progress_dialog = None  # Initialize progress_dialog variable
-                try:
-                    # Get selected columns
-                    selected_columns = [col for col, cb in checkboxes.items() if cb.isChecked()]
-                    if not selected_columns:
-                        QMessageBox.warning(dialog, "Warning", "Please select at least one column to export.")
-                        return
-                        
-                    # Get selected rows or all rows
-                    selected_rows = self.table.selectionModel().selectedRows()
-                    selected_indexes = [index.row() for index in selected_rows] if selected_rows else range(self.df.shape[0])
-                    export_df = self.df.iloc[selected_indexes].copy()  # Create a copy to avoid modifying original
-                    
-                    # Filter DataFrame to selected columns
-                    export_df = export_df[selected_columns]
-                    
-                    # Show progress dialog with improved UI
-                    progress_dialog = QDialog(self)
-                    progress_dialog.setWindowTitle("Exporting...")
-                    progress_dialog.setMinimumWidth(300)
-                    progress_dialog.setStyleSheet("""
-                        QDialog {
-                            background-color: #f4f6f7;
-                            border-radius: 10px;
-                        }
-                        QLabel {
-                            font-size: 14px;
-                            color: #2d3436;
-                            padding: 10px;
-                        }
-                        QProgressBar {
-                            border: 1px solid #dfe6e9;
-                            border-radius: 5px;
-                            text-align: center;
-                            background-color: #f4f6f7;
-                        }
-                        QProgressBar::chunk {
-                            background-color: #007AFF;
-                            border-radius: 4px;
-                        }
-                    """)
-                    
-                    progress_layout = QVBoxLayout()
-                    progress_label = QLabel("Exporting data, please wait...")
-                    progress_bar = QProgressBar()
-                    progress_bar.setRange(0, 0)  # Indeterminate progress
-                    progress_layout.addWidget(progress_label)
-                    progress_layout.addWidget(progress_bar)
-                    progress_dialog.setLayout(progress_layout)
-                    progress_dialog.show()
-                    
-                    # Process export based on file type
-                    if file_name.endswith(".csv"):
-                        export_df.to_csv(file_name, index=False, encoding='utf-8')
-                        self.status_label.setText("✅ CSV file exported successfully!")
-                        
-                    elif file_name.endswith(".json"):
-                        export_df.to_json(file_name, orient="records", indent=4, force_ascii=False)
-                        self.status_label.setText("✅ JSON file exported successfully!")
-                        
-                    elif file_name.endswith(".pdf"):
-                        from reportlab.lib import colors
-                        from reportlab.lib.pagesizes import letter, landscape
-                        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-                        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-                        
-                        # Create PDF document
-                        doc = SimpleDocTemplate(
-                            file_name,
-                            pagesize=landscape(letter),
-                            rightMargin=30,
-                            leftMargin=30,
-                            topMargin=30,
-                            bottomMargin=30
-                        )
-                        
-                        # Container for the 'Flowable' objects
-                        elements = []
-                        
-                        # Add title
-                        title_style = ParagraphStyle(
-                            'CustomTitle',
-                            parent=getSampleStyleSheet()['Heading1'],
-                            fontSize=16,
-                            spaceAfter=30
-                        )
-                        elements.append(Paragraph("Data Export Report", title_style))
-                        
-                        # Convert DataFrame to list of lists for table
-                        data = [export_df.columns.tolist()]  # Headers
-                        data.extend(export_df.values.tolist())  # Data
-                        
-                        # Create table
-                        table = Table(data)
-                        
-                        # Add style to table
-                        style = TableStyle([
-                            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                            ('FONTSIZE', (0, 0), (-1, 0), 12),
-                            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                            ('FONTSIZE', (0, 1), (-1, -1), 10),
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                        ])
-                        
-                        # Add style to table
-                        table.setStyle(style)
-                        
-                        # Add table to elements
-                        elements.append(table)
-                        
-                        # Build PDF
-                        doc.build(elements)
-                        self.status_label.setText("✅ PDF file exported successfully!")
-                        
-                    else:  # Excel files
-                        with pd.ExcelWriter(file_name, engine="xlsxwriter") as writer:
-                            export_df.to_excel(writer, index=False, sheet_name="Filtered Results")
-                            worksheet = writer.sheets["Filtered Results"]
-                            
-                            # Auto-adjust column widths
-                        for col_num, value in enumerate(export_df.columns.values):
-                                max_length = max(
-                                    len(str(value)),
-                                    export_df[value].astype(str).str.len().max()
-                                )
-                                worksheet.set_column(col_num, col_num, max_length + 2)
-                            
-                            # Add a header format
-                                header_format = writer.book.add_format({
-                                'bold': True,
-                                'bg_color': '#4B5563',
-                                'font_color': 'white',
-                                'border': 1
-                                })
-                            
-                            # Apply header format
-                        for col_num, value in enumerate(export_df.columns.values):
-                            worksheet.write(0, col_num, value, header_format)
-                        
-                        self.status_label.setText("✅ Excel file exported successfully!")
-                    
-                    if progress_dialog:
-                        progress_dialog.close()
-                    dialog.accept()
-                    
-                except Exception as e:
-                    if progress_dialog:
-                        progress_dialog.close()
-                    QMessageBox.critical(dialog, "Export Error", f"Failed to export file:\n{str(e)}")
-                    
-            def on_cancel():
-                dialog.reject()
-            
-            select_all.clicked.connect(on_select_all)
-            deselect_all.clicked.connect(on_deselect_all)
-            export_button.clicked.connect(on_export)
-            cancel_button.clicked.connect(on_cancel)
-            
-            # Show dialog
-            dialog.exec()
-                
-            self.logger.info(f"Export completed successfully to {file_name}")
-                
+            select_all.clicked.connect(lambda: self._set_export_columns_checked(True))
+            deselect_all.clicked.connect(lambda: self._set_export_columns_checked(False))
+            export_button.clicked.connect(self._export_selected_columns)
+            cancel_button.clicked.connect(dialog.reject)
+            self._export_dialog = dialog
+
+        if columns != self._export_columns:
+            # Replace the column items in a single insert
+            items = []
+            for column in columns:
+                item = QStandardItem(str(column))
+                item.setCheckable(True)
+                items.append(item)
+            self._export_column_model.clear()
+            self._export_column_model.appendColumn(items)
+            self._export_columns = columns
+
+        # Every export starts with all columns checked
+        self._set_export_columns_checked(True)
+        return self._export_dialog
+
+    def _set_export_columns_checked(self, checked):
+        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        model = self._export_column_model
+        for row in range(model.rowCount()):
+            model.item(row).setCheckState(state)
+
+    def _export_selected_columns(self):
+        """Write the checked columns to the chosen file"""
+        progress_dialog = None  # Initialize progress_dialog variable
+        try:
+            # Get selected columns
+            model = self._export_column_model
+            selected_columns = [
+                col for row, col in enumerate(self._export_columns)
+                if model.item(row).checkState() == Qt.CheckState.Checked
+            ]
+            if not selected_columns:
+                QMessageBox.warning(self._export_dialog, "Warning", "Please select at least one column to export.")
+                return
+
+            # Get the selected columns of the selected rows as shown in the table, or of all rows
+            selected_rows = self.table.selectionModel().selectedRows()
+            if selected_rows:
+                rows = np.fromiter((index.row() for index in selected_rows), dtype=np.intp, count=len(selected_rows))
+                export_df = self.table_model.get_rows(rows, selected_columns)
+            else:
+                export_df = self.df[selected_columns]
+
+            # Show progress dialog with improved UI
+            progress_dialog = QDialog(self)
+            progress_dialog.setWindowTitle("Exporting...")
+            progress_dialog.setMinimumWidth(300)
+            progress_dialog.setObjectName("exportProgressDialog")
+
+            progress_layout = QVBoxLayout()
+            progress_label = QLabel("Exporting data, please wait...")
+            progress_bar = QProgressBar()
+            progress_bar.setRange(0, 0)  # Indeterminate progress
+            progress_layout.addWidget(progress_label)
+            progress_layout.addWidget(progress_bar)
+            progress_dialog.setLayout(progress_layout)
+            progress_dialog.show()
+
+            # Write the file on a worker thread so the progress dialog keeps painting
+            self.export_thread = ExportThread(export_df, self._export_file_name)
+            self.export_thread.export_finished.connect(self.on_export_finished)
+            self.export_thread.error_occurred.connect(self.handle_export_error)
+            self._export_progress_dialog = progress_dialog
+            self.export_thread.start()
+            self._export_dialog.accept()
+
         except Exception as e:
-            self.logger.error(f"Error in export_data: {str(e)}", exc_info=True)
-            QMessageBox.critical(self, "Error", f"Failed to export file:\n{str(e)}")
+            if progress_dialog:
+                progress_dialog.close()
+            QMessageBox.critical(self._export_dialog, "Export Error", f"Failed to export file:\n{str(e)}")
+
+    def on_export_finished(self, file_name, file_format):
+        self._export_progress_dialog.close()
+        self.status_label.setText(f"✅ {file_format} file exported successfully!")
+        self.logger.info(f"Export completed successfully to {file_name}")
+
+    def handle_export_error(self, error_message):
+        self._export_progress_dialog.close()
+        QMessageBox.critical(self, "Export Error", f"Failed to export file:\n{error_message}")
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
@@ -1741,7 +1810,7 @@ class CSVSearchApp(QWidget):
     def dropEvent(self, event):
         for url in event.mimeData().urls():
             file_path = url.toLocalFile()
-        if file_path.endswith((".csv", ".xls", ".xlsx", ".xlsm", ".xlsb")):
+        if os.path.splitext(file_path)[1].lower() in SUPPORTED_EXTENSIONS:
             self.load_file(file_path)
 
     def show_visualization(self):
@@ -1772,64 +1841,58 @@ class CSVSearchApp(QWidget):
                 QMessageBox.warning(self, "Warning", "Please enter at least one search query.")
                 return
 
-            # Convert DataFrame to string type for searching
-            search_df = self.df.astype(str)
-
-            # Apply case sensitivity if specified
-            if not self.match_case_checkbox.isChecked():
-                search_df = search_df.apply(lambda x: x.str.lower())
+            # Search the cached flat string view; lowering the needle once replaces
+            # lowering every column of the DataFrame on every search
+            match_case = self.match_case_checkbox.isChecked()
+            cells = self._get_search_cells(match_case)
+            if not match_case:
                 query1 = query1.lower()
                 query2 = query2.lower()
 
-            # Create masks for each query with error handling
+            # Create masks for each query with error handling; an empty query is not
+            # scanned and gets the mask that leaves the other query's result unchanged
             try:
-                if self.entire_field_checkbox.isChecked():
-                    # For entire field match, use exact match with word boundaries
-                    mask1 = search_df.apply(lambda x: x.str.match(f'^{re.escape(query1)}$', na=False))
-                    mask2 = search_df.apply(lambda x: x.str.match(f'^{re.escape(query2)}$', na=False))
-                else:
-                    # For partial match, use contains with escaped pattern
-                    mask1 = search_df.apply(lambda x: x.str.contains(re.escape(query1), na=False))
-                    mask2 = search_df.apply(lambda x: x.str.contains(re.escape(query2), na=False))
+                mask1 = self._match_cells(cells, query1) if query1 else np.full(len(cells), logic != "OR")
+                mask2 = self._match_cells(cells, query2) if query2 else np.full(len(cells), logic == "AND")
             except Exception as e:
                 QMessageBox.warning(self, "Search Error", f"Invalid search pattern: {str(e)}")
                 return
 
-            # Combine masks based on logic
+            # Count matching cells before the masks are combined in place, for show_statistics
+            self._match_stats = (
+                self._match_stats_key(query1, query2, match_case),
+                sum(np.count_nonzero(mask) for query, mask in ((query1, mask1), (query2, mask2)) if query)
+            )
+
+            # Combine masks based on logic, in place to avoid extra cell-sized arrays
             if logic == "AND":
-                final_mask = mask1 & mask2
+                final_mask = np.logical_and(mask1, mask2, out=mask1)
             elif logic == "OR":
-                final_mask = mask1 | mask2
+                final_mask = np.logical_or(mask1, mask2, out=mask1)
             else:  # NOT
-                final_mask = mask1 & ~mask2
+                final_mask = np.logical_and(mask1, np.logical_not(mask2, out=mask2), out=mask1)
 
-            # Filter DataFrame with error handling
+            # Find the matching row positions with error handling
             try:
-                filtered_df = self.df[final_mask.any(axis=1)]
+                matched_rows = np.flatnonzero(final_mask.reshape(self.df.shape).any(axis=1))
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Failed to filter data: {str(e)}")
                 return
 
-            # Update display
-            self.display_data(filtered_df)
+            # Update display; the model shows the matching rows without a filtered copy
+            self.display_data(self.df, matched_rows)
 
-            # Update highlights in the model
-            if isinstance(self.table.model(), PandasTableModel):
-                highlight_patterns = []
-                if query1:
-                    if self.entire_field_checkbox.isChecked():
-                        highlight_patterns.append(f'^{re.escape(query1)}$')
-                else:
-                        highlight_patterns.append(re.escape(query1))
-                if query2:
-                    if self.entire_field_checkbox.isChecked():
-                        highlight_patterns.append(f'^{re.escape(query2)}$')
-                    else:
-                        highlight_patterns.append(re.escape(query2))
-                self.table.model().set_highlight_patterns(highlight_patterns)
+            # Update highlights in the model with one compiled pattern for both queries
+            highlight_patterns = []
+            combined = "|".join(f"(?:{re.escape(q)})" for q in (query1, query2) if q)
+            if combined:
+                if self.entire_field_checkbox.isChecked():
+                    combined = f"^(?:{combined})$"
+                highlight_patterns.append(re.compile(combined, 0 if match_case else re.IGNORECASE))
+            self.table_model.set_highlight_patterns(highlight_patterns)
 
             # Update status with detailed information
-            total_matches = len(filtered_df)
+            total_matches = len(matched_rows)
             total_rows = len(self.df)
             match_percentage = (total_matches / total_rows * 100) if total_rows > 0 else 0
             self.status_label.setText(f"Found {total_matches} matches ({match_percentage:.1f}% of total rows)")
@@ -1837,7 +1900,7 @@ class CSVSearchApp(QWidget):
             # Update statistics
             self.show_statistics()
 
-            self.logger.info(f"Search completed. Found {len(filtered_df)} matches")
+            self.logger.info(f"Search completed. Found {total_matches} matches")
             
         except Exception as e:
             self.logger.error(f"Error in search_data: {str(e)}", exc_info=True)
@@ -1852,9 +1915,22 @@ class CSVSearchApp(QWidget):
                 self.logger.info("Stopping loader thread")
                 self.loader_thread.stop()
                 self.loader_thread.wait()
-            
-            # Clear data
-            self.df = None
+            for sheet_thread in self.findChildren(SheetLoaderThread):
+                sheet_thread.wait()
+            if self.duplicate_thread and self.duplicate_thread.isRunning():
+                self.duplicate_thread.wait()
+            if self.export_thread and self.export_thread.isRunning():
+                self.export_thread.wait()
+            for cache_thread in self.findChildren(SearchCacheThread):
+                cache_thread.wait()
+            self._close_workbook()
+            
+            # Clear data and the caches derived from it
+            self._set_df(None)
+            self._sheet_cache = {}
+            if self._export_column_model is not None:
+                self._export_column_model.clear()
+            self._export_columns = None
             
             # Reset UI state
             self.file_name_label.setText("No file loaded")
@@ -1875,7 +1951,11 @@ class CSVSearchApp(QWidget):
             self.progress_bar.hide()
             
             # Clear table
-            self.table.setModel(None)
+            self.table_model.set_dataframe(pd.DataFrame())
+
+            # Return the freed buffers now when the process outlives the window
+            if self._persistent_mode:
+                gc.collect()
             
             self.logger.info("Application closed successfully")
             event.accept()
@@ -1894,6 +1974,9 @@ class VisualizationDialog(QDialog):
         self.logger.info("VisualizationDialog initialization completed")
 
     def initUI(self):
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        
         layout = QVBoxLayout()
         layout.setSpacing(10)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -1937,13 +2020,7 @@ class VisualizationDialog(QDialog):
 
         # Button container
         button_container = QWidget()
-        button_container.setStyleSheet("""
-            QWidget {
-                background-color: #e9ecef;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
+        button_container.setObjectName("dialogButtonContainer")
         button_layout = QHBoxLayout(button_container)
         button_layout.setSpacing(10)
 
@@ -1976,6 +2053,9 @@ class VisualizationDialog(QDialog):
             self.y_axis.setEnabled(False)
 
     def plot_chart(self):
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         try:
             self.logger.info("Starting chart plotting")
             self.figure.clear()
@@ -2068,6 +2148,8 @@ if __name__ == "__main__":
     try:
         logger.info("Starting application")
         app = QApplication(sys.argv)
+        app.setStyleSheet(load_stylesheet())
+        QTimer.singleShot(0, log_system_info)
         window = CSVSearchApp()
         window.show()
         logger.info("Application window displayed")
@@ -1,10 +1,14 @@
 import os
 import sys
+import ast
+import hashlib
 import shutil
 import subprocess
-import glob
 import logging
 import platform
+import importlib.metadata
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Configure logging
@@ -14,147 +18,253 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Detect the platform once; platform.system() may spawn uname
+SYSTEM = platform.system()
+ARCH = platform.machine()
+_PYINSTALLER_CHECKED = False
+
+# Loaded by name at runtime, so no import statement points the analysis at them:
+# sip by PyQt6 itself, calamine and pyarrow through pandas engine/dtype strings
+RUNTIME_IMPORTS = ('PyQt6.sip', 'python_calamine', 'pyarrow')
+# Packages whose submodules the analysis tends to miss when imported lazily
+HIDDEN_IMPORT_PREFIXES = ('PyQt6.', 'matplotlib.backends.')
+
+# Finished bundles are kept here, keyed by a hash of everything that goes into them
+BUILD_CACHE_DIR = '.build_cache'
+BUILD_INPUTS = ('Code_V1.py', 'requirements.txt', 'app.qss', 'version_info.txt')
+
+# The macOS spec; only the hidden imports are filled in at build time
+SPEC_TEMPLATE = 'CSV_Search_App.spec.template'
+
+def _fast_rmtree(path):
+    """Remove a directory tree with the platform's native recursive delete"""
+    if os.name == 'nt':
+        # cmd reads forward slashes as switches, so pass a native path
+        cmd = ['cmd', '/c', 'rd', '/s', '/q', os.path.normpath(path)]
+    else:
+        cmd = ['rm', '-rf', path]
+    try:
+        subprocess.run(cmd, check=False, capture_output=True)
+    except OSError as e:
+        logger.warning(f"Native delete unavailable for {path}: {str(e)}")
+    # Finish anything the native command could not remove
+    if os.path.exists(path):
+        shutil.rmtree(path, ignore_errors=True)
+
 def clean_build():
     """Clean previous build files"""
     try:
-        dirs_to_clean = ['build', 'dist']
-        files_to_clean = ['*.spec']
+        dirs_to_clean = ['build', 'dist', BUILD_CACHE_DIR]
         
         for dir_name in dirs_to_clean:
             if os.path.exists(dir_name):
                 logger.info(f"Removing directory: {dir_name}")
-                try:
-                    shutil.rmtree(dir_name)
-                except Exception as e:
-                    logger.warning(f"Failed to remove {dir_name}: {str(e)}")
-                    # Try to remove individual files if directory removal fails
-                    for root, dirs, files in os.walk(dir_name, topdown=False):
-                        for name in files:
-                            try:
-                                os.remove(os.path.join(root, name))
-                            except Exception as e:
-                                logger.warning(f"Failed to remove file {name}: {str(e)}")
-                        for name in dirs:
-                            try:
-                                os.rmdir(os.path.join(root, name))
-                            except Exception as e:
-                                logger.warning(f"Failed to remove directory {name}: {str(e)}")
-                    try:
-                        os.rmdir(dir_name)
-                    except Exception as e:
-                        logger.warning(f"Failed to remove empty directory {dir_name}: {str(e)}")
-        
-        for pattern in files_to_clean:
-            for file in glob.glob(pattern):
-                logger.info(f"Removing file: {file}")
-                try:
-                    os.remove(file)
-                except Exception as e:
-                    logger.warning(f"Failed to remove file {file}: {str(e)}")
+                _fast_rmtree(dir_name)
+                if os.path.exists(dir_name):
+                    logger.warning(f"Failed to remove {dir_name} completely")
+        
+        # scandir entries carry their file type, so no extra stat per file
+        spec_files = [entry.name for entry in os.scandir('.') if entry.is_file() and entry.name.endswith('.spec')]
+        for file in spec_files:
+            logger.info(f"Removing file: {file}")
+            try:
+                os.remove(file)
+            except Exception as e:
+                logger.warning(f"Failed to remove file {file}: {str(e)}")
                 
         logger.info("Clean build completed successfully")
     except Exception as e:
         logger.error(f"Error during clean build: {str(e)}")
         raise
 
-def build_app():
-    """Build the app for the current platform"""
+def _run_logged(cmd):
+    """Run cmd, logging its combined output line by line, and return its exit code"""
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+    
+    # Print output in real-time
+    for line in iter(process.stdout.readline, ''):
+        logger.info(line.strip())
+    
+    process.stdout.close()
+    return process.wait()
+
+def _move_or_copy(src, dst):
+    """Move the built bundle into the release directory, copying only across filesystems"""
     try:
-        # Detect platform
-        system = platform.system()
-        arch = platform.machine()
-        
-        if system == "Windows":
-            build_windows_exe()
-        elif system == "Darwin":  # macOS
-            build_macos(arch)
+        os.rename(src, dst)
+        return "Moved"
+    except OSError:
+        shutil.copytree(src, dst)
+        return "Copied"
+
+def _discover_hidden_imports(source='Code_V1.py'):
+    """Return the hidden imports for source: its hard-to-detect imports plus RUNTIME_IMPORTS"""
+    with open(source, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=source)
+    found = set(RUNTIME_IMPORTS)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names = [node.module]
+        else:
+            continue
+        found.update(name for name in names if name.startswith(HIDDEN_IMPORT_PREFIXES))
+    return sorted(found)
+
+def _ensure_pyinstaller():
+    """Install PyInstaller if missing; checked once per run without importing it"""
+    global _PYINSTALLER_CHECKED
+    if _PYINSTALLER_CHECKED:
+        return
+    if importlib.util.find_spec('PyInstaller') is None:
+        logger.error("PyInstaller not found. Installing...")
+        subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"])
+    else:
+        logger.info(f"PyInstaller version: {importlib.metadata.version('pyinstaller')}")
+    _PYINSTALLER_CHECKED = True
+
+def _copy_release_files(release_dir):
+    """Create release_dir and copy the README, license and requirements into it"""
+    if not os.path.exists(release_dir):
+        os.makedirs(release_dir, exist_ok=True)
+        logger.info(f"Created release directory: {release_dir}")
+    for name in ('README.md', 'LICENSE', 'requirements.txt'):
+        if os.path.exists(name):
+            # copyfile skips the permission-bit copy shutil.copy does for each file
+            shutil.copyfile(name, os.path.join(release_dir, name))
+            logger.info(f"Copied {name} to release directory")
         else:
-            logger.error(f"Unsupported platform: {system}")
-            raise Exception(f"Building for {system} is not supported yet")
+            logger.warning(f"Source file not found: {name}")
+
+def _build_cache_key(*texts):
+    """Hash the build inputs, the build command/spec text, the interpreter and installed packages"""
+    # A local cache key needs no cryptographic strength; BLAKE2b is faster than SHA-256
+    digest = hashlib.blake2b(digest_size=16)
+    for name in BUILD_INPUTS:
+        if os.path.exists(name):
+            with open(name, 'rb') as f:
+                digest.update(f.read())
+        digest.update(b'\0')
+    # requirements.txt only sets minimum versions, so the bundled libraries are whatever is installed
+    installed = sorted(
+        (dist.metadata['Name'] or '', dist.version or '')
+        for dist in importlib.metadata.distributions()
+    )
+    for text in (*texts, sys.version, repr(installed), SYSTEM, ARCH):
+        digest.update(text.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def _store_build_cache(bundle_path, cache_path):
+    """Keep a copy of the finished bundle as the only cache entry"""
+    try:
+        if os.path.exists(BUILD_CACHE_DIR):
+            _fast_rmtree(BUILD_CACHE_DIR)
+        shutil.copytree(bundle_path, cache_path, symlinks=True)
+    except Exception as e:
+        logger.warning(f"Failed to cache the build: {str(e)}")
+
+def _build_and_stage(build_cmd, release_dir, bundle_path, *key_texts):
+    """Build (or reuse a cached bundle) while the release directory is staged on a worker thread"""
+    cache_key = _build_cache_key(repr(build_cmd), *key_texts)
+    cache_path = os.path.join(BUILD_CACHE_DIR, cache_key, os.path.basename(bundle_path))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        staging = executor.submit(_copy_release_files, release_dir)
+        if os.path.exists(cache_path):
+            logger.info(f"Build inputs unchanged; reusing cached bundle {cache_key[:12]}")
+            if os.path.exists(bundle_path):
+                _fast_rmtree(bundle_path)
+            shutil.copytree(cache_path, bundle_path, symlinks=True)
+            return_code = 0
+        else:
+            return_code = _run_logged(build_cmd)
+            if return_code == 0:
+                _store_build_cache(bundle_path, cache_path)
+        staging.result()
+    return return_code
+
+def build_app(clean=False):
+    """Build the app for the current platform; clean discards PyInstaller's cached analysis first"""
+    try:
+        if SYSTEM == "Windows":
+            build_windows_exe(clean)
+        elif SYSTEM == "Darwin":  # macOS
+            build_macos(ARCH, clean)
+        else:
+            logger.error(f"Unsupported platform: {SYSTEM}")
+            raise Exception(f"Building for {SYSTEM} is not supported yet")
             
     except Exception as e:
         logger.error(f"Build process failed: {str(e)}")
         raise
 
-def build_windows_exe():
+def build_windows_exe(clean=False):
     """Build the Windows executable"""
     try:
-        # Clean previous builds
-        clean_build()
+        # Keep build/ between runs so PyInstaller can reuse its analysis unless asked to clean
+        if clean:
+            clean_build()
         
         # Create version info
         version = datetime.now().strftime("%Y.%m.%d")
         logger.info(f"Building Windows executable version: {version}")
         
         # Check if PyInstaller is installed
-        try:
-            import PyInstaller
-            logger.info(f"PyInstaller version: {PyInstaller.__version__}")
-        except ImportError:
-            logger.error("PyInstaller not found. Installing...")
-            subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        _ensure_pyinstaller()
+        
+        hidden_imports = _discover_hidden_imports()
         
-        # Create spec file first with Windows-specific settings
-        spec_cmd = [
+        # Write the spec file and build from it in one PyInstaller run
+        build_cmd = [
             sys.executable,
             "-m",
             "PyInstaller",
             '--name=CSV_Search_App',
             '--windowed',  # No console window
-            '--clean',
+            *(['--clean'] if clean else []),
             '--noconfirm',
-            '--onefile',  # Create a single executable
-            '--win-private-assemblies',  # Include private assemblies
+            '--onedir',  # Ship a folder so nothing is extracted on every launch
+            '--contents-directory=lib',  # Keep the bundled libraries out of the top folder
+            '--noupx',  # UPX-packed binaries are decompressed on every launch
+            '--optimize=1',  # Compile bundled modules with asserts stripped
             f'--version-file=version_info.txt',
             '--add-data=requirements.txt;.',  # Windows uses semicolon
+            '--add-data=app.qss;.',
+            *[f'--hidden-import={name}' for name in hidden_imports],
+            '--exclude-module=tkinter',
+            '--exclude-module=test',
+            '--exclude-module=pydoc_data',
             '--specpath=.',
             'Code_V1.py'
         ]
         
-        logger.info("Creating spec file...")
-        result = subprocess.run(spec_cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            logger.error(f"Spec file creation failed:\n{result.stderr}")
-            raise Exception("Spec file creation failed")
-        
-        # Build using the spec file
-        build_cmd = [
-            sys.executable,
-            "-m",
-            "PyInstaller",
-            '--clean',
-            '--noconfirm',
-            'CSV_Search_App.spec'
-        ]
-        
+        # The static release files don't depend on the build, so stage them meanwhile
+        release_dir = f'release_windows_{version}'
+        bundle_path = 'dist/CSV_Search_App'
         logger.info("Starting PyInstaller build...")
-        result = subprocess.run(build_cmd, capture_output=True, text=True)
+        return_code = _build_and_stage(build_cmd, release_dir, bundle_path)
         
-        if result.returncode != 0:
-            logger.error(f"PyInstaller build failed:\n{result.stderr}")
+        if return_code != 0:
+            logger.error(f"PyInstaller build failed with return code: {return_code}")
             raise Exception("PyInstaller build failed")
         
-        # Create release directory
-        release_dir = f'release_windows_{version}'
-        if not os.path.exists(release_dir):
-            os.makedirs(release_dir)
-            logger.info(f"Created release directory: {release_dir}")
-        
-        # Copy files to release directory
-        files_to_copy = [
-            ('dist/CSV_Search_App.exe', 'CSV_Search_App.exe'),
-            ('README.md', 'README.md'),
-            ('LICENSE', 'LICENSE'),
-            ('requirements.txt', 'requirements.txt')
-        ]
-        
-        for src, dst in files_to_copy:
-            if os.path.exists(src):
-                shutil.copy(src, os.path.join(release_dir, dst))
-                logger.info(f"Copied {src} to release directory")
-            else:
-                logger.warning(f"Source file not found: {src}")
+        # Move the whole onedir bundle to the release directory
+        if os.path.exists(bundle_path):
+            target_path = os.path.join(release_dir, 'CSV_Search_App')
+            if os.path.exists(target_path):
+                _fast_rmtree(target_path)
+            action = _move_or_copy(bundle_path, target_path)
+            logger.info(f"{action} {bundle_path} to release directory")
+        else:
+            logger.error(f"Application folder not found: {bundle_path}")
+            raise Exception("Application folder not found")
         
         logger.info(f"\nWindows executable build completed successfully!")
         logger.info(f"Release files are in the '{release_dir}' directory")
@@ -163,178 +273,70 @@ def build_windows_exe():
         logger.error(f"Windows executable build failed: {str(e)}")
         raise
 
-def build_macos(arch):
+def build_macos(arch, clean=False):
     """Build the macOS application"""
     try:
-        # Clean previous builds
-        clean_build()
+        # Keep build/ between runs so PyInstaller can reuse its analysis unless asked to clean
+        if clean:
+            clean_build()
         
         # Create version info
         version = datetime.now().strftime("%Y.%m.%d")
         logger.info(f"Building macOS version: {version}")
         
         # Check if PyInstaller is installed
-        try:
-            import PyInstaller
-            logger.info(f"PyInstaller version: {PyInstaller.__version__}")
-        except ImportError:
-            logger.error("PyInstaller not found. Installing...")
-            subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        _ensure_pyinstaller()
         
         logger.info(f"Building for architecture: {arch}")
         
         # macOS uses colon as path separator for PyInstaller
         path_sep = ":"
         
-        # Create a custom .spec file instead of using command-line args
-        spec_content = f"""
-# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-a = Analysis(
-    ['Code_V1.py'],
-    pathex=[],
-    binaries=[],
-    datas=[('requirements.txt', '.')],
-    hiddenimports=[
-        'PIL._tkinter_finder',
-        'pandas',
-        'polars',
-        'PyQt6',
-        'PyQt6.QtCore',
-        'PyQt6.QtGui',
-        'PyQt6.QtWidgets',
-        'PyQt6.sip',
-        'matplotlib',
-        'matplotlib.backends.backend_qt5agg',
-        'matplotlib.backends.backend_qt5',
-        'matplotlib.backends.backend_agg',
-        'matplotlib.backends.backend_svg',
-        'matplotlib.backends.backend_pdf',
-        'matplotlib.backends.backend_ps',
-        'seaborn',
-        'numpy',
-        'openpyxl',
-        'xlsxwriter',
-        'reportlab',
-        'psutil'
-    ],
-    hookspath=[],
-    hooksconfig={{}},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    [],
-    exclude_binaries=True,
-    name='CSV_Search_App',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=True,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
-
-coll = COLLECT(
-    exe,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    name='CSV_Search_App',
-)
-
-app = BUNDLE(
-    coll,
-    name='CSV_Search_App.app',
-    icon=None,
-    bundle_identifier=None,
-)
-"""
-        
-        # Write the spec file
-        with open('CSV_Search_App.spec', 'w') as f:
-            f.write(spec_content)
-        
-        logger.info("Created custom spec file")
+        # Create a custom .spec file from the checked-in template instead of using command-line args
+        hidden_imports = _discover_hidden_imports()
+        
+        with open(SPEC_TEMPLATE, encoding='utf-8') as f:
+            spec_content = f.read().format_map({'hidden_imports': repr(hidden_imports)})
+        
+        # Write the spec file only when it changed so its mtime stays stable between builds
+        existing_spec = None
+        if os.path.exists('CSV_Search_App.spec'):
+            with open('CSV_Search_App.spec', encoding='utf-8') as f:
+                existing_spec = f.read()
+        if existing_spec != spec_content:
+            with open('CSV_Search_App.spec', 'w', encoding='utf-8') as f:
+                f.write(spec_content)
+            logger.info("Created custom spec file")
+        else:
+            logger.info("Spec file is up to date")
         
         # Build using the spec file
         build_cmd = [
             sys.executable,
             "-m",
             "PyInstaller",
-            '--clean',
+            *(['--clean'] if clean else []),
             '--noconfirm',
             'CSV_Search_App.spec'
         ]
         
+        # The static release files don't depend on the build, so stage them meanwhile
+        release_dir = f'release_macos_{arch}_{version}'
+        app_path = 'dist/CSV_Search_App.app'
         logger.info("Starting PyInstaller build...")
-        # Run the command and capture real-time output
-        process = subprocess.Popen(
-            build_cmd, 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
-        )
-        
-        # Print output in real-time
-        for line in iter(process.stdout.readline, ''):
-            logger.info(line.strip())
-        
-        process.stdout.close()
-        return_code = process.wait()
+        return_code = _build_and_stage(build_cmd, release_dir, app_path, spec_content)
         
         if return_code != 0:
             logger.error(f"PyInstaller build failed with return code: {return_code}")
             raise Exception("PyInstaller build failed")
         
-        # Create release directory
-        release_dir = f'release_macos_{arch}_{version}'
-        if not os.path.exists(release_dir):
-            os.makedirs(release_dir)
-            logger.info(f"Created release directory: {release_dir}")
-        
-        # For macOS, we need to copy the entire .app bundle
-        app_path = 'dist/CSV_Search_App.app'
+        # For macOS, we need to move the entire .app bundle
         if os.path.exists(app_path):
             target_path = os.path.join(release_dir, 'CSV_Search_App.app')
-            # Use shutil.copytree for directories
             if os.path.exists(target_path):
-                shutil.rmtree(target_path)
-            shutil.copytree(app_path, target_path)
-            logger.info(f"Copied {app_path} to release directory")
-            
-            # Copy additional files
-            extra_files = [
-                ('README.md', 'README.md'),
-                ('LICENSE', 'LICENSE'),
-                ('requirements.txt', 'requirements.txt')
-            ]
-            
-            for src, dst in extra_files:
-                if os.path.exists(src):
-                    shutil.copy(src, os.path.join(release_dir, dst))
-                    logger.info(f"Copied {src} to release directory")
-                else:
-                    logger.warning(f"Source file not found: {src}")
+                _fast_rmtree(target_path)
+            action = _move_or_copy(app_path, target_path)
+            logger.info(f"{action} {app_path} to release directory")
         else:
             logger.error(f"App bundle not found: {app_path}")
             raise Exception("App bundle not found")
@@ -347,4 +349,4 @@ app = BUNDLE(
         raise
 
 if __name__ == '__main__':
-    build_app()
\ No newline at end of file
+    build_app(clean='--clean' in sys.argv[1:])
\ No newline at end of file